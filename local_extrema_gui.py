@@ -8,12 +8,193 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import io
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+from collections import namedtuple
 from typing import List, Tuple, Dict
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.font_manager as fm
 import numpy as np
-from unified_extrema_detector import UnifiedExtremaDetector
+from unified_extrema_detector import UnifiedExtremaDetector, Extrema
+# matplotlib과 SciPy는 가져오는 데 시간이 오래 걸리므로 처음 필요할 때 가져옴 (창이 먼저 뜨도록)
+
+
+class DifferencePairs(namedtuple('DifferencePairs', ['max_idx', 'max_val', 'min_idx', 'min_val', 'diff'])):
+    """최대값-최소값 쌍들을 열별 배열(인덱스/값/차이값)로 저장하는 SoA 구조"""
+    __slots__ = ()
+    
+    @classmethod
+    def empty(cls):
+        """쌍이 하나도 없는 DifferencePairs를 만듭니다."""
+        no_idx = np.empty(0, dtype=np.int64)
+        no_val = np.empty(0, dtype=np.float64)
+        return cls(no_idx, no_val, no_idx, no_val, no_val)
+    
+    def rows(self):
+        """(쌍 번호, 최대값 인덱스, 최대값, 최소값 인덱스, 최소값, 차이값) 행들을 반환합니다."""
+        return zip(range(1, self.diff.size + 1), self.max_idx.tolist(), self.max_val.tolist(),
+                   self.min_idx.tolist(), self.min_val.tolist(), self.diff.tolist())
+
+
+@functools.lru_cache(maxsize=1)
+def _kdtree_class():
+    """SciPy의 cKDTree 클래스 (SciPy가 없으면 None → 벡터화된 전체 탐색으로 대체)"""
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return None
+    return cKDTree
+
+
+@functools.lru_cache(maxsize=1)
+def _available_fonts():
+    """설치된 폰트 이름 집합 (폰트 목록 스캔은 프로세스당 한 번만 수행)"""
+    from matplotlib import font_manager
+    return frozenset(f.name for f in font_manager.fontManager.ttflist)
+
+
+def _find_label_lines(content, label):
+    """
+    파일 내용(bytes)에서 라벨 하나만 있는 줄들을 찾습니다.
+    
+    Returns:
+        [(줄 시작 위치, 다음 줄 시작 위치), ...] 리스트
+    """
+    lines = []
+    pos = content.find(label)
+    while pos >= 0:
+        line_start = content.rfind(b'\n', 0, pos) + 1
+        line_end = content.find(b'\n', pos)
+        if line_end < 0:
+            line_end = len(content)
+        if content[line_start:line_end].strip() == label:
+            lines.append((line_start, line_end + 1))
+        pos = content.find(label, line_end)
+    return lines
+
+
+def _parse_float_lines(chunk):
+    """
+    한 줄에 하나씩 적힌 실수들(bytes)을 배열로 변환합니다.
+    
+    np.loadtxt의 C 파서로 한 번에 읽고, 숫자가 아닌 줄이 섞여 있으면
+    해당 줄만 건너뛰며 한 줄씩 다시 읽습니다.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # 빈 구간 경고 무시
+            values = np.loadtxt(io.BytesIO(chunk), dtype=np.float64, comments=None, ndmin=2)
+        # 한 줄에 값이 하나인 경우만 사용 (한 줄짜리 구간도 열 개수로 구분)
+        if values.shape[1] == 1:
+            return values.ravel()
+    except ValueError:
+        pass
+    
+    values = []
+    for line in chunk.decode('utf-8').splitlines():
+        line = line.strip()
+        if line:
+            try:
+                values.append(float(line))
+            except ValueError:
+                pass
+    return np.array(values, dtype=np.float64)
+
+
+def _top_k_by_abs(val, k):
+    """
+    절댓값이 큰 순서로 상위 k개의 위치를 반환합니다.
+    
+    sorted(..., key=abs, reverse=True)[:k]와 같은 결과(같은 절댓값은 원래 순서 유지)를
+    전체 정렬 없이 argpartition으로 구합니다.
+    """
+    mag = np.abs(val)
+    kth = mag[np.argpartition(-mag, k - 1)[:k]].min()
+    
+    # 경계값보다 큰 원소는 모두 포함하고, 경계값과 같은 원소는 앞에서부터 채움
+    above = np.flatnonzero(mag > kth)
+    ties = np.flatnonzero(mag == kth)[:k - above.size]
+    sel = np.sort(np.concatenate((above, ties)))
+    return sel[np.argsort(-mag[sel], kind='stable')]
+
+
+def _refine_selections(y, sel_idx, window_size, find_max):
+    """
+    선택된 각 인덱스 주변 ±window_size 구간에서 실제 최대값(또는 최소값)의 위치를 찾습니다.
+    
+    선택한 점이 이미 구간의 극값이면 그 점을 유지하고, 아니면 구간에서 처음 나오는 극값을 사용합니다.
+    여러 선택이 같은 극값으로 모이면 처음 한 번만 남깁니다.
+    
+    Returns:
+        Extrema (인덱스 배열, 값 배열)
+    """
+    if sel_idx.size == 0:
+        return Extrema(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+    
+    # 선택 개수 x 윈도우 크기의 인덱스 행렬 (데이터 경계에서는 잘라냄)
+    offsets = np.arange(-window_size, window_size + 1)
+    windows = np.clip(sel_idx[:, None] + offsets, 0, len(y) - 1)
+    local = y[windows]
+    best = local.argmax(axis=1) if find_max else local.argmin(axis=1)
+    idx = windows[np.arange(sel_idx.size), best]
+    idx = np.where(y[sel_idx] == y[idx], sel_idx, idx)
+    
+    # 선택 순서를 유지하면서 중복 제거
+    _, first = np.unique(idx, return_index=True)
+    idx = idx[np.sort(first)]
+    return Extrema(idx, y[idx])
+
+
+def _sorted_by_index(extrema):
+    """인덱스 순으로 정렬한 Extrema를 반환합니다 (같은 인덱스는 원래 순서 유지)."""
+    order = np.argsort(extrema.idx, kind='stable')
+    return Extrema(extrema.idx[order], extrema.val[order])
+
+
+def _lttb_downsample(x, y, n_out=3000):
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 방식으로 그래프용 데이터를 다운샘플링합니다.
+    
+    Args:
+        x: X 좌표 배열
+        y: Y 좌표 배열
+        n_out: 출력할 최대 점 개수
+        
+    Returns:
+        다운샘플링된 (x, y) 배열 튜플
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+    
+    # 첫 점과 마지막 점을 제외한 구간을 n_out - 2개의 버킷으로 나눔
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        
+        # 다음 버킷의 평균점 (마지막 버킷은 마지막 점 사용)
+        if i + 1 < n_out - 2:
+            next_x, next_y = avg_x[i + 1], avg_y[i + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        
+        # 이전 선택점, 다음 버킷 평균점과 만드는 삼각형 넓이가 가장 큰 점 선택
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) -
+                      (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
 
 
 class LocalExtremaGUI:
@@ -23,11 +204,20 @@ class LocalExtremaGUI:
         self.root.geometry("1200x800")
         self.root.configure(bg='#f0f0f0')
         
-        # 데이터 저장 변수
-        self.data = []
-        self.x_data = []
-        self.y_data = []
+        # 데이터 저장 변수 (x_data/y_data/data는 이 배열들을 그대로 돌려주는 속성)
+        self._x_arr = np.empty(0)  # X 데이터 배열
+        self._y_arr = np.empty(0)  # Y 데이터 배열 (분석 대상)
+        self._kdtree = None  # 정규화 좌표 기반 최근접 점 탐색 트리
+        self._y_hash = None  # 현재 Y 데이터의 해시 (탐지 결과 캐시 키)
+        self._detect_cache = {}  # (데이터 해시, 방법, 파라미터) -> (minima, maxima)
+        self._last_render_key = None  # 마지막으로 만든 결과 텍스트의 키 (데이터 해시, 파일, 분석 설정)
+        self._last_render_text = ''  # 마지막으로 만든 결과 텍스트
+        self._data_stats = None  # 현재 데이터의 특성 분석 결과 (파일을 로드할 때마다 초기화)
+        self._executor = ThreadPoolExecutor(max_workers=1)  # 탐지 실행용 백그라운드 스레드
+        self._pending_analysis = None  # 진행 중인 백그라운드 분석 (future, 분석 설정)
+        self._plot_after_id = None  # 예약된 극값 그래프 갱신 (연속 분석 시 마지막 것만 그림)
         self.current_file_path = ""
+        self._file_basename = ""  # 결과/제목 표시에 쓰는 파일 이름 (로드할 때 한 번만 계산)
         self.results = {}
         self.figure = None
         self.canvas = None
@@ -38,19 +228,50 @@ class LocalExtremaGUI:
         # 인터랙티브 선택 변수
         self.selected_maxima = []  # 사용자가 선택한 최대값들
         self.selected_minima = []  # 사용자가 선택한 최소값들
+        self._max_idx_set = set()  # 중복 선택 확인용 최대값 인덱스 집합
+        self._min_idx_set = set()  # 중복 선택 확인용 최소값 인덱스 집합
         self.interactive_mode = False  # 인터랙티브 모드 상태
         
         # 차이값 계산 결과 저장
-        self.difference_results = []  # 최대값-최소값 차이값들
-        
-        # 한글 폰트 설정
-        self.setup_korean_font()
+        self.difference_results = DifferencePairs.empty()  # 최대값-최소값 차이값들
         
         # GUI 구성 요소 생성
         self.create_widgets()
+        
+        # 분석 파라미터는 입력값이 바뀔 때만 파싱
+        self.bind_param_vars()
+        
+        # 창을 닫을 때 백그라운드 분석 스레드도 정리
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        """창을 닫을 때 대기 중인 분석을 취소하고 창을 제거합니다."""
+        # 분석은 한 번에 하나만 제출되므로 그 future만 취소하면 됨
+        # (shutdown의 cancel_futures는 Python 3.9 이상에서만 지원)
+        if self._pending_analysis is not None:
+            self._pending_analysis[0].cancel()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+    
+    @property
+    def x_data(self):
+        """X 데이터 배열"""
+        return self._x_arr
+    
+    @property
+    def y_data(self):
+        """Y 데이터 배열"""
+        return self._y_arr
+    
+    @property
+    def data(self):
+        """분석 대상 데이터 (Y 데이터 배열, 기존 코드 호환성)"""
+        return self._y_arr
     
     def setup_korean_font(self):
         """한글 폰트를 설정합니다."""
+        import matplotlib
+        
         try:
             # Windows에서 사용 가능한 한글 폰트 찾기
             font_candidates = [
@@ -60,19 +281,19 @@ class LocalExtremaGUI:
                 'DejaVu Sans'
             ]
             
-            available_fonts = [f.name for f in fm.fontManager.ttflist]
+            available_fonts = _available_fonts()
             
             for font in font_candidates:
                 if font in available_fonts:
-                    plt.rcParams['font.family'] = font
+                    matplotlib.rcParams['font.family'] = font
                     break
             else:
                 # 한글 폰트를 찾지 못한 경우 기본 폰트 사용
-                plt.rcParams['font.family'] = 'DejaVu Sans'
+                matplotlib.rcParams['font.family'] = 'DejaVu Sans'
                 
         except Exception as e:
             print(f"폰트 설정 중 오류: {e}")
-            plt.rcParams['font.family'] = 'DejaVu Sans'
+            matplotlib.rcParams['font.family'] = 'DejaVu Sans'
         
     def create_widgets(self):
         """GUI 위젯들을 생성합니다."""
@@ -203,9 +424,9 @@ class LocalExtremaGUI:
         ttk.Label(param_frame, text="이하 (999이면 제한 없음)").grid(row=6, column=2, sticky=tk.W, padx=(5, 0), pady=(5, 0))
         
         # 분석 실행 버튼
-        analyze_button = ttk.Button(left_frame, text="3. 분석 실행", 
+        self.analyze_button = ttk.Button(left_frame, text="3. 분석 실행", 
                                    command=self.run_analysis, style='Accent.TButton')
-        analyze_button.grid(row=3, column=0, columnspan=3, pady=(0, 10))
+        self.analyze_button.grid(row=3, column=0, columnspan=3, pady=(0, 10))
         
         # 결과 표시 섹션
         result_frame = ttk.LabelFrame(left_frame, text="4. 분석 결과", padding="10")
@@ -235,8 +456,8 @@ class LocalExtremaGUI:
         ttk.Button(button_frame, text="결과 지우기", 
                   command=self.clear_results).pack(side=tk.LEFT)
         
-        # 그래프 영역 설정
-        self.setup_graph_area(right_frame)
+        # 그래프 영역 설정 (matplotlib 로딩이 느리므로 창이 먼저 뜬 뒤에 생성)
+        self.root.after(10, self.setup_graph_area, right_frame)
         
         # 그리드 가중치 설정
         self.root.columnconfigure(0, weight=1)
@@ -285,8 +506,14 @@ class LocalExtremaGUI:
     
     def setup_graph_area(self, parent_frame):
         """그래프 영역을 설정합니다."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
+        # 한글 폰트 설정
+        self.setup_korean_font()
+        
         # matplotlib figure 생성
-        self.figure = plt.Figure(figsize=(8, 6), dpi=100)
+        self.figure = Figure(figsize=(8, 6), dpi=100)
         self.ax = self.figure.add_subplot(111)
         
         # 캔버스 생성 및 배치
@@ -299,71 +526,211 @@ class LocalExtremaGUI:
         self.ax.set_ylabel('Y')
         self.ax.grid(True, alpha=0.3)
         
+        # 데이터 선/극값 마커 (다시 그릴 때마다 새로 만들지 않고 데이터만 갱신)
+        self.create_plot_artists()
+        
+        # 선택된 점 표시용 마커 (클릭마다 새로 만들지 않고 데이터만 갱신)
+        self.create_selection_markers()
+        
         # 마우스 호버 이벤트 설정
         self.setup_hover_events()
+        
+        # 확대/축소 시 보이는 구간만 다시 다운샘플링
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+        
+        # 호버/클릭 판정 반경은 축 범위가 바뀔 때만 다시 계산
+        self.ax.callbacks.connect('xlim_changed', self.update_hit_radius)
+        self.ax.callbacks.connect('ylim_changed', self.update_hit_radius)
+        self.update_hit_radius()
+    
+    def create_plot_artists(self):
+        """원본 데이터 선과 탐지된 극값 마커를 생성합니다."""
+        self._data_line, = self.ax.plot([], [], 'b-', linewidth=1, alpha=0.7, label='Data', markersize=2)
+        self._maxima_line, = self.ax.plot([], [], '^', linestyle='None', markersize=7, color='red',
+                                          alpha=0.8, label='_nolegend_')
+        self._minima_line, = self.ax.plot([], [], 'v', linestyle='None', markersize=7, color='green',
+                                          alpha=0.8, label='_nolegend_')
+        self._lttb_range = (0, 0)
+    
+    def create_selection_markers(self):
+        """사용자가 선택한 최대값/최소값을 표시할 마커를 생성합니다."""
+        self._max_marker, = self.ax.plot([], [], '^', linestyle='None', markersize=10, color='red',
+                                         markeredgecolor='darkred', markeredgewidth=2, alpha=0.9)
+        self._min_marker, = self.ax.plot([], [], 'v', linestyle='None', markersize=10, color='green',
+                                         markeredgecolor='darkgreen', markeredgewidth=2, alpha=0.9)
+    
+    def reset_overlays(self):
+        """그래프를 다시 그리기 전에 선택 마커와 호버 주석을 초기 상태로 되돌립니다."""
+        self._max_marker.set_data([], [])
+        self._min_marker.set_data([], [])
+        self.hover_annotation.set_visible(False)
+        self.current_hover_point = None
     
     def setup_hover_events(self):
         """마우스 호버 이벤트를 설정합니다."""
         # 호버 상태를 저장할 변수들
-        self.hover_annotation = None
         self.current_hover_point = None
+        self._bg = None  # 블리팅용 배경 (호버 주석을 제외한 화면)
+        self._blit_pending = False  # 호버 주석 다시 그리기가 예약되어 있는지 여부
+        self.create_hover_annotation()
         
         # 마우스 이벤트 연결
         self.canvas.mpl_connect("motion_notify_event", self.on_hover)
         self.canvas.mpl_connect("axes_leave_event", self.on_leave)
         self.canvas.mpl_connect("button_press_event", self.on_click)
+        
+        # 전체 다시 그리기(플롯 갱신, 창 크기 변경 등) 후 배경을 다시 저장
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.canvas.mpl_connect("resize_event", self.on_resize)
+    
+    def create_hover_annotation(self):
+        """호버 주석을 생성합니다 (블리팅으로만 그려지도록 animated로 설정)."""
+        self.hover_annotation = self.ax.annotate(
+            '',
+            xy=(0, 0),
+            xytext=(10, 10),
+            textcoords='offset points',
+            fontsize=9,
+            bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
+            arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'),
+            zorder=10,
+            visible=False,
+            animated=True
+        )
+    
+    def on_draw(self, event):
+        """캔버스 전체를 그린 뒤 블리팅용 배경을 저장합니다."""
+        # 주석이 삐져나갈 수 있으므로 축 영역이 아닌 figure 전체를 저장
+        self._bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.hover_annotation.get_visible():
+            self.ax.draw_artist(self.hover_annotation)
+    
+    def on_resize(self, event):
+        """창 크기가 바뀌면 저장된 배경을 무효화하고 판정 반경을 다시 계산합니다."""
+        self._bg = None
+        self.update_hit_radius()
+    
+    def update_hit_radius(self, ax=None):
+        """화면상 5픽셀 반경을 데이터 좌표의 X/Y 반경(제곱)으로 환산해 둡니다."""
+        inv = self.ax.transData.inverted()
+        (x0, y0), (x1, y1) = inv.transform([(0, 0), (5, 5)])
+        self._hit_rx2 = (x1 - x0)**2 or 1.0
+        self._hit_ry2 = (y1 - y0)**2 or 1.0
+    
+    def schedule_hover_blit(self):
+        """호버 주석 다시 그리기를 예약합니다 (마우스가 빨리 움직여도 유휴 주기당 한 번만 그림)."""
+        if self._blit_pending:
+            return
+        self._blit_pending = True
+        self.root.after_idle(self.flush_hover_blit)
+    
+    def flush_hover_blit(self):
+        """예약된 호버 주석 다시 그리기를 실행합니다."""
+        self._blit_pending = False
+        self.blit_hover_annotation()
+    
+    def blit_hover_annotation(self):
+        """호버 주석만 다시 그려 화면에 반영합니다."""
+        if self._bg is None:
+            # 배경이 아직 없으면 전체 다시 그리기 (on_draw에서 배경 저장)
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self._bg)
+        if self.hover_annotation.get_visible():
+            self.ax.draw_artist(self.hover_annotation)
+        self.canvas.blit(self.figure.bbox)
     
     def on_hover(self, event):
         """마우스 호버 이벤트 핸들러"""
         if event.inaxes != self.ax:
             return
         
-        # 기존 호버 주석 제거
-        if self.hover_annotation:
-            self.hover_annotation.remove()
-            self.hover_annotation = None
-        
         # 데이터가 없으면 리턴
-        if not hasattr(self, 'x_data') or not self.x_data or not self.y_data:
+        if not self._y_arr.size:
             return
         
         # 마우스 위치에서 가장 가까운 데이터 포인트 찾기
+        hover_point = None
         if event.xdata is not None and event.ydata is not None:
-            # 모든 데이터 포인트와의 거리 계산
-            distances = []
-            for i, (x, y) in enumerate(zip(self.x_data, self.y_data)):
-                dist = np.sqrt((event.xdata - x)**2 + (event.ydata - y)**2)
-                distances.append((dist, i, x, y))
-            
-            # 가장 가까운 포인트 찾기
-            if distances:
-                min_dist, idx, x_val, y_val = min(distances)
-                
-                # 호버 반경 설정 (화면 좌표 기준)
-                if min_dist < 0.05:  # 적절한 호버 반경
-                    # 호버 주석 생성
-                    self.hover_annotation = self.ax.annotate(
-                        f'X: {x_val:.4f}\nY: {y_val:.4f}',
-                        xy=(x_val, y_val),
-                        xytext=(10, 10),
-                        textcoords='offset points',
-                        fontsize=9,
-                        bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
-                        arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'),
-                        zorder=10
-                    )
-                    self.current_hover_point = (x_val, y_val)
-                    
-                    # 캔버스 업데이트
-                    self.canvas.draw_idle()
+            # 호버 반경: 화면상 5픽셀 이내 (X/Y 축 배율이 달라도 타원 판정으로 보정)
+            idx = self.find_nearest_point(event.xdata, event.ydata)
+            if idx is not None:
+                hover_point = (float(self._x_arr[idx]), float(self._y_arr[idx]))
+        
+        # 호버 대상이 바뀌지 않았으면 다시 그릴 필요 없음
+        if hover_point == self.current_hover_point:
+            return
+        self.current_hover_point = hover_point
+        
+        # 호버 주석 갱신
+        if hover_point is not None:
+            x_val, y_val = hover_point
+            self.hover_annotation.xy = hover_point
+            self.hover_annotation.set_text(f'X: {x_val:.4f}\nY: {y_val:.4f}')
+            self.hover_annotation.set_visible(True)
+        else:
+            self.hover_annotation.set_visible(False)
+        
+        # 캔버스 업데이트 (주석만 블리팅)
+        self.schedule_hover_blit()
+    
+    def build_point_index(self):
+        """호버/클릭에 사용할 최근접 점 탐색 인덱스를 생성합니다."""
+        # 축 범위로 정규화하여 하나의 반경이 화면상 거리에 대응하도록 함
+        # (Y 최소/최대값은 파일 정보와 결과 표시에서도 재사용)
+        self._x_min = float(self._x_arr.min())
+        self._y_min = float(self._y_arr.min())
+        self._y_max = float(self._y_arr.max())
+        self._x_scale = float(self._x_arr.max()) - self._x_min or 1.0
+        self._y_scale = self._y_max - self._y_min or 1.0
+        # 정규화 좌표는 화면상 최근접 점 찾기에만 쓰이므로 float32로 보관 (메모리/대역폭 절반)
+        self._xn = ((self._x_arr - self._x_min) / self._x_scale).astype(np.float32)
+        self._yn = ((self._y_arr - self._y_min) / self._y_scale).astype(np.float32)
+        
+        # 트리는 파일을 로드할 때 한 번만 생성
+        cKDTree = _kdtree_class()
+        if cKDTree is not None:
+            self._kdtree = cKDTree(np.column_stack([self._xn, self._yn]))
+        else:
+            self._kdtree = None
+    
+    def find_nearest_point(self, x, y):
+        """
+        주어진 좌표에서 화면상 5픽셀 반경 안에 있는 가장 가까운 데이터 포인트의 인덱스를 반환합니다.
+        
+        거리는 현재 보기 기준의 타원 거리(dx²/rx² + dy²/ry²)로 비교하며, 반경 안에 점이 없으면 None을 반환합니다.
+        """
+        xn = (x - self._x_min) / self._x_scale
+        yn = (y - self._y_min) / self._y_scale
+        
+        if self._kdtree is not None:
+            # 정규화 좌표에서 타원을 감싸는 원 안의 후보만 모음 (float32 좌표 오차만큼 여유를 둠)
+            r = max(np.sqrt(self._hit_rx2) / self._x_scale, np.sqrt(self._hit_ry2) / self._y_scale)
+            cand = np.sort(np.asarray(self._kdtree.query_ball_point([xn, yn], r * (1 + 1e-3) + 1e-6),
+                                      dtype=np.intp))
+            if not cand.size:
+                return None
+        else:
+            # SciPy가 없으면 전체 점에 대한 타원 거리를 정규화 좌표로 한 번에 계산
+            ax2 = np.float32(self._x_scale**2 / self._hit_rx2)
+            ay2 = np.float32(self._y_scale**2 / self._hit_ry2)
+            d2 = (self._xn - np.float32(xn))**2 * ax2 + (self._yn - np.float32(yn))**2 * ay2
+            cand = np.flatnonzero(d2 < 1 + 1e-3)
+            if not cand.size:
+                return None
+        
+        # 후보 중 타원 거리가 가장 작은 점을 원래 좌표로 확인
+        d = (self._x_arr[cand] - x)**2 / self._hit_rx2 + (self._y_arr[cand] - y)**2 / self._hit_ry2
+        j = int(d.argmin())
+        return int(cand[j]) if d[j] < 1 else None
     
     def on_leave(self, event):
         """마우스가 그래프 영역을 벗어날 때 호출"""
-        if self.hover_annotation:
-            self.hover_annotation.remove()
-            self.hover_annotation = None
+        if self.hover_annotation.get_visible():
+            self.hover_annotation.set_visible(False)
             self.current_hover_point = None
-            self.canvas.draw_idle()
+            self.schedule_hover_blit()
     
     def toggle_mode(self):
         """탐지 모드를 전환합니다."""
@@ -383,33 +750,27 @@ class LocalExtremaGUI:
         if not self.interactive_mode or event.inaxes != self.ax:
             return
         
-        if not hasattr(self, 'x_data') or not self.x_data or not self.y_data:
+        if not self._y_arr.size:
             return
         
         if event.xdata is not None and event.ydata is not None:
-            # 가장 가까운 데이터 포인트 찾기
-            distances = []
-            for i, (x, y) in enumerate(zip(self.x_data, self.y_data)):
-                dist = np.sqrt((event.xdata - x)**2 + (event.ydata - y)**2)
-                distances.append((dist, i, x, y))
-            
-            if distances:
-                min_dist, idx, x_val, y_val = min(distances)
-                
-                # 클릭 반경 설정
-                if min_dist < 0.05:
-                    if event.button == 1:  # 좌클릭 - 최대값 선택
-                        self.add_maximum(idx, x_val, y_val)
-                    elif event.button == 3:  # 우클릭 - 최소값 선택
-                        self.add_minimum(idx, x_val, y_val)
+            # 클릭 반경(화면상 5픽셀) 안의 가장 가까운 데이터 포인트 찾기
+            idx = self.find_nearest_point(event.xdata, event.ydata)
+            if idx is not None:
+                x_val = float(self._x_arr[idx])
+                y_val = float(self._y_arr[idx])
+                if event.button == 1:  # 좌클릭 - 최대값 선택
+                    self.add_maximum(idx, x_val, y_val)
+                elif event.button == 3:  # 우클릭 - 최소값 선택
+                    self.add_minimum(idx, x_val, y_val)
     
     def add_maximum(self, idx, x_val, y_val):
         """최대값을 추가합니다."""
         # 중복 확인
-        for existing_idx, _, _ in self.selected_maxima:
-            if existing_idx == idx:
-                return
+        if idx in self._max_idx_set:
+            return
         
+        self._max_idx_set.add(idx)
         self.selected_maxima.append((idx, x_val, y_val))
         self.update_selection_info()
         self.update_graph_with_selections()
@@ -417,10 +778,10 @@ class LocalExtremaGUI:
     def add_minimum(self, idx, x_val, y_val):
         """최소값을 추가합니다."""
         # 중복 확인
-        for existing_idx, _, _ in self.selected_minima:
-            if existing_idx == idx:
-                return
+        if idx in self._min_idx_set:
+            return
         
+        self._min_idx_set.add(idx)
         self.selected_minima.append((idx, x_val, y_val))
         self.update_selection_info()
         self.update_graph_with_selections()
@@ -429,6 +790,8 @@ class LocalExtremaGUI:
         """선택된 점들을 초기화합니다."""
         self.selected_maxima = []
         self.selected_minima = []
+        self._max_idx_set.clear()
+        self._min_idx_set.clear()
         self.update_selection_info()
         self.update_graph_with_selections()
     
@@ -444,26 +807,14 @@ class LocalExtremaGUI:
         if not hasattr(self, 'ax') or not self.ax:
             return
         
-        # 기존 선택 표시 제거
-        for artist in self.ax.collections[:]:
-            if hasattr(artist, '_is_selection'):
-                artist.remove()
-        
-        # 선택된 최대값 표시
-        if self.selected_maxima:
-            max_x = [x for _, x, _ in self.selected_maxima]
-            max_y = [y for _, _, y in self.selected_maxima]
-            scatter = self.ax.scatter(max_x, max_y, s=100, c='red', marker='^', 
-                                    alpha=0.9, edgecolors='darkred', linewidth=2)
-            scatter._is_selection = True
-        
-        # 선택된 최소값 표시
-        if self.selected_minima:
-            min_x = [x for _, x, _ in self.selected_minima]
-            min_y = [y for _, _, y in self.selected_minima]
-            scatter = self.ax.scatter(min_x, min_y, s=100, c='green', marker='v', 
-                                    alpha=0.9, edgecolors='darkgreen', linewidth=2)
-            scatter._is_selection = True
+        # 선택된 최대값/최소값 마커 갱신
+        max_x = np.array([x for _, x, _ in self.selected_maxima], dtype=np.float64)
+        max_y = np.array([y for _, _, y in self.selected_maxima], dtype=np.float64)
+        self._max_marker.set_data(max_x, max_y)
+        
+        min_x = np.array([x for _, x, _ in self.selected_minima], dtype=np.float64)
+        min_y = np.array([y for _, _, y in self.selected_minima], dtype=np.float64)
+        self._min_marker.set_data(min_x, min_y)
         
         self.canvas.draw_idle()
     
@@ -511,7 +862,15 @@ class LocalExtremaGUI:
 - enhanced: 향상된 교차 패턴 방법
 - strict: 엄격한 조건 적용 방법
 """
-        self.result_text.insert(tk.END, message)
+        self.write_result_text(message, clear=True)
+    
+    def write_result_text(self, text, clear=False):
+        """결과 창에 텍스트를 한 번에 추가합니다 (평소에는 읽기 전용으로 두어 중간 편집/재배치를 막음)."""
+        self.result_text.config(state=tk.NORMAL)
+        if clear:
+            self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, text)
+        self.result_text.config(state=tk.DISABLED)
     
     def select_file(self):
         """파일 선택 다이얼로그를 열고 파일을 로드합니다."""
@@ -525,49 +884,29 @@ class LocalExtremaGUI:
     
     def parse_xy_data(self, file_path):
         """X-Y 좌표 데이터를 파싱합니다."""
-        x_data = []
-        y_data = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-            
-            # X, Y 라벨 찾기
-            x_start = -1
-            y_start = -1
+            with open(file_path, 'rb') as file:
+                content = file.read()
             
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line == 'X' or line == 'x':
-                    x_start = i + 1
-                elif line == 'Y' or line == 'y':
-                    y_start = i + 1
+            # X, Y 라벨 줄의 위치만 먼저 찾음 (숫자 변환은 하지 않음)
+            x_labels = _find_label_lines(content, b'X') + _find_label_lines(content, b'x')
+            y_labels = sorted(_find_label_lines(content, b'Y') + _find_label_lines(content, b'y'))
             
-            # X 데이터 파싱
-            if x_start >= 0:
-                for i in range(x_start, len(lines)):
-                    line = lines[i].strip()
-                    if line == 'Y' or line == 'y':
-                        break
-                    if line:
-                        try:
-                            x_data.append(float(line))
-                        except ValueError:
-                            pass
+            # X 데이터 파싱 (X 라벨 다음 줄부터 Y 라벨 전까지)
+            x_data = np.empty(0)
+            if x_labels:
+                x_start = max(x_labels)[1]
+                x_end = next((start for start, _ in y_labels if start >= x_start), len(content))
+                x_data = _parse_float_lines(content[x_start:x_end])
             
-            # Y 데이터 파싱
-            if y_start >= 0:
-                for i in range(y_start, len(lines)):
-                    line = lines[i].strip()
-                    if line:
-                        try:
-                            y_data.append(float(line))
-                        except ValueError:
-                            pass
+            # Y 데이터 파싱 (Y 라벨 다음 줄부터 파일 끝까지)
+            y_data = np.empty(0)
+            if y_labels:
+                y_data = _parse_float_lines(content[y_labels[-1][1]:])
             
             # X 라벨이 없으면 인덱스를 X로 사용
-            if not x_data and y_data:
-                x_data = list(range(len(y_data)))
+            if not x_data.size and y_data.size:
+                x_data = np.arange(len(y_data), dtype=np.float64)
             
             # 데이터 길이 맞추기
             min_len = min(len(x_data), len(y_data))
@@ -582,29 +921,41 @@ class LocalExtremaGUI:
     
     def load_file(self, file_path):
         """선택된 파일을 로드하고 데이터를 읽습니다."""
+        # 백그라운드 분석이 현재 데이터를 사용 중이면 끝날 때까지 새 파일을 받지 않음
+        if self._pending_analysis is not None:
+            messagebox.showwarning("경고", "분석이 진행 중입니다. 분석이 끝난 뒤 다시 시도해주세요.")
+            return
+        
         try:
             # X-Y 데이터 파싱 시도
-            self.x_data, self.y_data = self.parse_xy_data(file_path)
+            x_arr, y_arr = self.parse_xy_data(file_path)
             
-            if not self.y_data:
+            if not y_arr.size:
                 messagebox.showerror("오류", "파일에서 유효한 데이터를 찾을 수 없습니다.")
                 return
             
-            # Y 데이터를 data로 설정 (기존 코드 호환성)
-            self.data = self.y_data.copy()
+            # 파싱한 배열을 그대로 보관 (분석, 호버/클릭 탐색, 그래프에 모두 사용)
+            self._x_arr = x_arr
+            self._y_arr = y_arr
+            self.build_point_index()
+            
+            # 새 데이터이므로 탐지 결과 캐시와 데이터 특성 분석 결과를 비움
+            self._y_hash = hashlib.blake2b(y_arr.tobytes(), digest_size=8).hexdigest()
+            self._detect_cache.clear()
+            self._data_stats = None
             
             self.current_file_path = file_path
-            filename = os.path.basename(file_path)
-            self.file_label.config(text=f"선택된 파일: {filename}")
+            self._file_basename = os.path.basename(file_path)
+            self.file_label.config(text=f"선택된 파일: {self._file_basename}")
             
             # 파일 정보 표시
-            file_info = f"X 데이터: {len(self.x_data)}개 | Y 데이터: {len(self.y_data)}개 | 최대값: {max(self.y_data):.6f} | 최소값: {min(self.y_data):.6f}"
+            file_info = f"X 데이터: {x_arr.size}개 | Y 데이터: {y_arr.size}개 | 최대값: {self._y_max:.6f} | 최소값: {self._y_min:.6f}"
             self.file_info_label.config(text=file_info)
             
             # 그래프 그리기
             self.plot_data()
             
-            messagebox.showinfo("성공", f"파일이 성공적으로 로드되었습니다.\nX 데이터: {len(self.x_data)}개, Y 데이터: {len(self.y_data)}개")
+            messagebox.showinfo("성공", f"파일이 성공적으로 로드되었습니다.\nX 데이터: {x_arr.size}개, Y 데이터: {y_arr.size}개")
             
         except FileNotFoundError:
             messagebox.showerror("오류", "파일을 찾을 수 없습니다.")
@@ -613,58 +964,131 @@ class LocalExtremaGUI:
     
     def plot_data(self):
         """데이터를 그래프로 그립니다."""
-        if not self.x_data or not self.y_data:
+        if not self._y_arr.size:
             return
         
-        # 그래프 클리어
-        self.ax.clear()
+        # 이전 극값/선택 표시를 먼저 비워 자동 축 범위에 포함되지 않도록 함
+        self.clear_overlay_artists()
         
         # 데이터 플롯
-        self.ax.plot(self.x_data, self.y_data, 'b-', linewidth=1, alpha=0.7, label='Data')
-        self.ax.scatter(self.x_data, self.y_data, s=1, c='blue', alpha=0.5)
+        self.plot_data_line()
         
-        # 그래프 설정
-        self.ax.set_title(f'Data Graph - {os.path.basename(self.current_file_path)}')
-        self.ax.set_xlabel('X')
-        self.ax.set_ylabel('Y')
-        self.ax.grid(True, alpha=0.3)
+        # 그래프 설정 및 캔버스 업데이트
+        self.show_data_graph()
+    
+    def clear_extrema_display(self):
+        """데이터 선은 그대로 두고 극값/선택 표시만 지웁니다."""
+        self.clear_overlay_artists()
+        self.show_data_graph()
+    
+    def clear_overlay_artists(self):
+        """극값/선택/호버 표시를 비웁니다 (아직 그리지 않은 극값 표시 예약도 취소)."""
+        self.cancel_scheduled_plot()
+        self.reset_overlays()
+        self.set_extrema_markers(Extrema.from_pairs([]), Extrema.from_pairs([]))
+    
+    def show_data_graph(self):
+        """원본 데이터 그래프의 제목/범례를 설정하고 캔버스를 갱신합니다."""
+        self.set_graph_title(f'Data Graph - {self._file_basename}')
         self.ax.legend()
+        self.canvas.draw_idle()
+    
+    def plot_data_line(self):
+        """원본 데이터 선을 그립니다 (점이 많으면 LTTB로 다운샘플링)."""
+        self._lttb_range = (0, len(self._x_arr))
+        self._data_line.set_data(*_lttb_downsample(self._x_arr, self._y_arr))
+        self.update_point_markers()
+        
+        # 다운샘플링으로 빠진 점이 있어도 전체 데이터 범위가 보이도록 함
+        self.ax.relim()
+        self.ax.update_datalim([(self._x_min, self._y_min),
+                                (self._x_min + self._x_scale, self._y_min + self._y_scale)])
+        self.ax.autoscale()
+    
+    def on_xlim_changed(self, ax):
+        """X축 범위가 바뀌면 보이는 구간을 다시 다운샘플링합니다."""
+        x0, x1 = sorted(ax.get_xlim())
+        visible = np.flatnonzero((self._x_arr >= x0) & (self._x_arr <= x1))
+        if visible.size == 0:
+            return
         
-        # 캔버스 업데이트
-        self.canvas.draw()
+        # 화면 가장자리까지 선이 이어지도록 양쪽으로 한 점씩 더 포함
+        lo = max(int(visible[0]) - 1, 0)
+        hi = min(int(visible[-1]) + 2, len(self._x_arr))
+        if (lo, hi) == self._lttb_range:
+            return
+        
+        self._lttb_range = (lo, hi)
+        self._data_line.set_data(*_lttb_downsample(self._x_arr[lo:hi], self._y_arr[lo:hi]))
+        self.update_point_markers()
+    
+    def update_point_markers(self):
+        """보이는 점이 적을 때(확대 시)만 데이터 선에 개별 점 마커를 표시합니다."""
+        lo, hi = self._lttb_range
+        self._data_line.set_marker('.' if hi - lo < 500 else '')
+    
+    def schedule_plot_extrema(self, minima, maxima):
+        """극값 그래프 갱신을 잠시 미뤄, 분석이 연달아 실행되면 마지막 결과만 그립니다."""
+        self.cancel_scheduled_plot()
+        self._plot_after_id = self.root.after(50, self.run_scheduled_plot, minima, maxima)
+    
+    def cancel_scheduled_plot(self):
+        """예약된 극값 그래프 갱신을 취소합니다."""
+        if self._plot_after_id is not None:
+            self.root.after_cancel(self._plot_after_id)
+            self._plot_after_id = None
+    
+    def run_scheduled_plot(self, minima, maxima):
+        """예약된 극값 그래프 갱신을 실행합니다."""
+        self._plot_after_id = None
+        self.plot_extrema(minima, maxima)
     
     def plot_extrema(self, minima, maxima):
         """극값을 그래프에 표시합니다."""
-        if not self.x_data or not self.y_data:
+        if not self._y_arr.size:
             return
         
-        # 그래프 클리어 후 다시 그리기
-        self.ax.clear()
-        
-        # 원본 데이터 플롯
-        self.ax.plot(self.x_data, self.y_data, 'b-', linewidth=1, alpha=0.7, label='Data')
-        self.ax.scatter(self.x_data, self.y_data, s=1, c='blue', alpha=0.5)
+        # 이전 선택/호버 표시 초기화 (데이터 선은 그대로 재사용)
+        self.reset_overlays()
         
         # 극값 표시 (호버로 좌표 확인 가능)
-        if maxima:
-            max_x = [self.x_data[idx] for idx, _ in maxima]
-            max_y = [val for _, val in maxima]
-            self.ax.scatter(max_x, max_y, s=50, c='red', marker='^', label=f'Maxima ({len(maxima)})', alpha=0.8)
-        
-        if minima:
-            min_x = [self.x_data[idx] for idx, _ in minima]
-            min_y = [val for _, val in minima]
-            self.ax.scatter(min_x, min_y, s=50, c='green', marker='v', label=f'Minima ({len(minima)})', alpha=0.8)
+        self.set_extrema_markers(minima, maxima)
         
         # 그래프 설정
-        self.ax.set_title(f'Local Extrema Analysis - {os.path.basename(self.current_file_path)}')
-        self.ax.set_xlabel('X')
-        self.ax.set_ylabel('Y')
-        self.ax.grid(True, alpha=0.3)
+        self.set_graph_title(f'Local Extrema Analysis - {self._file_basename}')
         self.ax.legend()
         
         # 캔버스 업데이트
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def set_graph_title(self, title):
+        """그래프 제목이 바뀐 경우에만 다시 설정합니다."""
+        if self.ax.get_title() != title:
+            self.ax.set_title(title)
+    
+    def set_extrema_markers(self, minima, maxima):
+        """극값 마커의 좌표와 범례 라벨을 갱신합니다 (비어 있으면 범례에서 제외)."""
+        self._maxima_line.set_data(self._x_arr[maxima.idx], maxima.val)
+        self._maxima_line.set_label(f'Maxima ({maxima.idx.size})' if maxima.idx.size else '_nolegend_')
+        self._minima_line.set_data(self._x_arr[minima.idx], minima.val)
+        self._minima_line.set_label(f'Minima ({minima.idx.size})' if minima.idx.size else '_nolegend_')
+    
+    def bind_param_vars(self):
+        """분석 파라미터 입력칸에 trace를 연결하여 값이 바뀔 때마다 숫자로 변환해 둡니다."""
+        self._params = {}
+        for name, var, cast in [('threshold', self.threshold_var, float),
+                                ('window_size', self.window_size_var, int),
+                                ('max_threshold', self.max_threshold_var, float),
+                                ('min_threshold', self.min_threshold_var, float)]:
+            var.trace_add('write', lambda *_, n=name, v=var, c=cast: self.parse_param(n, v, c))
+            self.parse_param(name, var, cast)
+    
+    def parse_param(self, name, var, cast):
+        """입력값을 숫자로 변환해 저장합니다 (숫자가 아니면 None)."""
+        try:
+            self._params[name] = cast(var.get())
+        except ValueError:
+            self._params[name] = None
     
     def get_user_constraints(self):
         """사용자가 설정한 제약 조건을 가져옵니다."""
@@ -681,11 +1105,30 @@ class LocalExtremaGUI:
             return None, None
     
     def find_local_extrema_unified(self, data, method="auto", **kwargs):
-        """통합된 탐지 시스템을 사용하여 로컬 극값을 찾습니다."""
+        """통합된 탐지 시스템을 사용하여 로컬 극값을 찾습니다 (Extrema 형태로 반환).
+        
+        같은 데이터에 같은 방법/파라미터로 다시 실행하면 캐시된 결과를 돌려줍니다.
+        """
+        cached = self.cached_extrema(method, **kwargs)
+        if cached is not None:
+            return cached
+        
+        # 데이터 특성(변동성, 노이즈 레벨 등)은 파라미터와 무관하므로 데이터당 한 번만 분석
+        if self._data_stats is None:
+            self._data_stats = self.detector.analyze_data_characteristics(data)
+        
         if method == "auto":
-            return self.detector.detect_extrema(data, **kwargs)
+            minima, maxima = self.detector.detect_extrema(data, characteristics=self._data_stats, **kwargs)
         else:
-            return self.detector.detect_extrema(data, method=method, **kwargs)
+            minima, maxima = self.detector.detect_extrema(data, method=method,
+                                                          characteristics=self._data_stats, **kwargs)
+        result = (Extrema.from_pairs(minima), Extrema.from_pairs(maxima))
+        self._detect_cache[(self._y_hash, method, frozenset(kwargs.items()))] = result
+        return result
+    
+    def cached_extrema(self, method, **kwargs):
+        """현재 데이터에 같은 방법/파라미터로 탐지한 결과가 캐시에 있으면 반환합니다 (없으면 None)."""
+        return self._detect_cache.get((self._y_hash, method, frozenset(kwargs.items())))
     
     
     def apply_threshold_filter(self, minima, maxima, max_threshold, min_threshold):
@@ -693,8 +1136,8 @@ class LocalExtremaGUI:
         최대값과 최소값에 임계값 필터링을 적용합니다.
         
         Args:
-            minima: 최소값 리스트 [(인덱스, 값), ...]
-            maxima: 최대값 리스트 [(인덱스, 값), ...]
+            minima: 최소값 Extrema (인덱스 배열, 값 배열)
+            maxima: 최대값 Extrema (인덱스 배열, 값 배열)
             max_threshold: 최대값 임계값 (이상이어야 함)
             min_threshold: 최소값 임계값 (이하여야 함)
         
@@ -703,17 +1146,15 @@ class LocalExtremaGUI:
         """
         # 최대값 필터링: max_threshold 이상인 값만 유지
         if max_threshold > 0:
-            filtered_maxima = [(idx, val) for idx, val in maxima if val >= max_threshold]
-        else:
-            filtered_maxima = maxima
+            keep = maxima.val >= max_threshold
+            maxima = Extrema(maxima.idx[keep], maxima.val[keep])
         
         # 최소값 필터링: min_threshold 이하인 값만 유지 (999는 제한 없음을 의미)
         if min_threshold < 999:
-            filtered_minima = [(idx, val) for idx, val in minima if val <= min_threshold]
-        else:
-            filtered_minima = minima
+            keep = minima.val <= min_threshold
+            minima = Extrema(minima.idx[keep], minima.val[keep])
         
-        return filtered_minima, filtered_maxima
+        return minima, maxima
     
     def filter_results_by_count(self, minima, maxima, max_count_limit, min_count_limit, method="auto"):
         """결과를 개수 제한에 따라 필터링합니다."""
@@ -723,31 +1164,34 @@ class LocalExtremaGUI:
             return minima, maxima
         
         # 다른 방법들에서는 기존 방식 사용
-        # 최대값을 절댓값 기준으로 정렬하여 상위 N개 선택
-        if max_count_limit > 0 and len(maxima) > max_count_limit:
-            maxima_sorted = sorted(maxima, key=lambda x: abs(x[1]), reverse=True)
-            maxima = maxima_sorted[:max_count_limit]
+        # 최대값을 절댓값 기준으로 상위 N개 선택
+        if max_count_limit > 0 and maxima.idx.size > max_count_limit:
+            sel = _top_k_by_abs(maxima.val, max_count_limit)
+            maxima = Extrema(maxima.idx[sel], maxima.val[sel])
         
-        # 최소값을 절댓값 기준으로 정렬하여 상위 N개 선택
-        if min_count_limit > 0 and len(minima) > min_count_limit:
-            minima_sorted = sorted(minima, key=lambda x: abs(x[1]), reverse=True)
-            minima = minima_sorted[:min_count_limit]
+        # 최소값을 절댓값 기준으로 상위 N개 선택
+        if min_count_limit > 0 and minima.idx.size > min_count_limit:
+            sel = _top_k_by_abs(minima.val, min_count_limit)
+            minima = Extrema(minima.idx[sel], minima.val[sel])
         
         return minima, maxima
     
     def run_analysis(self):
         """분석을 실행합니다."""
-        if not self.data:
+        if not self._y_arr.size:
             messagebox.showerror("오류", "먼저 데이터 파일을 선택해주세요.")
             return
         
+        # 이전 분석이 아직 진행 중이면 무시
+        if self._pending_analysis is not None:
+            return
+        
         # 모드 확인
         mode = self.mode_var.get()
         
         # 분석 실행
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, "분석을 시작합니다...\n\n")
-        self.root.update()
+        self.write_result_text("분석을 시작합니다...\n\n", clear=True)
+        self.root.update_idletasks()
         
         try:
             if mode == "manual":
@@ -764,14 +1208,14 @@ class LocalExtremaGUI:
                     'minima': minima,
                     'maxima': maxima,
                     'method': 'manual_selection',
-                    'file': os.path.basename(self.current_file_path)
+                    'file': self._file_basename
                 }
                 
                 # 결과 표시
                 self.display_manual_results(minima, maxima)
                 
                 # 그래프에 극값 표시
-                self.plot_extrema(minima, maxima)
+                self.schedule_plot_extrema(minima, maxima)
                 
             else:
                 # 자동 탐지 모드
@@ -783,57 +1227,94 @@ class LocalExtremaGUI:
                 # 파라미터 가져오기
                 method = self.method_var.get()
                 
-                try:
-                    threshold = float(self.threshold_var.get())
-                    window_size = int(self.window_size_var.get())
-                    max_threshold = float(self.max_threshold_var.get())
-                    min_threshold = float(self.min_threshold_var.get())
-                except ValueError:
+                if None in self._params.values():
                     messagebox.showerror("오류", "모든 임계값과 윈도우 크기는 숫자여야 합니다.")
                     return
+                threshold = self._params['threshold']
+                window_size = self._params['window_size']
+                max_threshold = self._params['max_threshold']
+                min_threshold = self._params['min_threshold']
                 
-                # 통합된 탐지 시스템 사용
-                if method == "auto":
-                    minima, maxima = self.find_local_extrema_unified(self.data, method="auto", 
-                                                                   threshold=threshold, window_size=window_size)
+                settings = (self._y_hash, method, threshold, window_size,
+                            max_count_limit, min_count_limit, max_threshold, min_threshold)
+                cached = self.cached_extrema(method, threshold=threshold, window_size=window_size)
+                if cached is not None:
+                    # 캐시된 결과는 스레드/폴링 없이 바로 반영
+                    self.show_analysis_result(cached, *settings)
                 else:
-                    minima, maxima = self.find_local_extrema_unified(self.data, method=method, 
-                                                                   threshold=threshold, window_size=window_size)
-                
-                # 모든 방법에 대해 임계값 필터링 적용
-                minima, maxima = self.apply_threshold_filter(minima, maxima, max_threshold, min_threshold)
-                
-                # 결과 필터링
-                minima, maxima = self.filter_results_by_count(minima, maxima, max_count_limit, min_count_limit, method)
-                
-                # 결과 저장
-                self.results = {
-                    'minima': minima,
-                    'maxima': maxima,
-                    'method': method,
-                    'file': os.path.basename(self.current_file_path)
-                }
-                
-                # 결과 표시
-                self.display_results(minima, maxima, method, max_count_limit, min_count_limit, max_threshold, min_threshold)
-                
-                # 그래프에 극값 표시
-                self.plot_extrema(minima, maxima)
+                    # 통합된 탐지 시스템을 백그라운드 스레드에서 실행 (GUI 멈춤 방지)
+                    self.analyze_button.config(state=tk.DISABLED)
+                    self.write_result_text("극값을 탐지하는 중입니다...\n")
+                    future = self._executor.submit(self.find_local_extrema_unified, self._y_arr, method=method,
+                                                   threshold=threshold, window_size=window_size)
+                    self._pending_analysis = (future, settings)
+                    self.root.after(50, self.poll_analysis)
             
         except Exception as e:
             messagebox.showerror("오류", f"분석 중 오류가 발생했습니다:\n{str(e)}")
-            self.result_text.insert(tk.END, f"오류 발생: {str(e)}\n")
+            self.write_result_text(f"오류 발생: {str(e)}\n")
+    
+    def poll_analysis(self):
+        """백그라운드 분석 완료 여부를 확인하고, 완료되면 결과를 반영합니다."""
+        future, settings = self._pending_analysis
+        if not future.done():
+            self.root.after(50, self.poll_analysis)
+            return
+        
+        self._pending_analysis = None
+        self.analyze_button.config(state=tk.NORMAL)
+        
+        # 분석 도중 다른 파일이 로드되었으면 결과를 버림
+        if settings[0] != self._y_hash:
+            return
+        
+        try:
+            self.show_analysis_result(future.result(), *settings)
+        except Exception as e:
+            messagebox.showerror("오류", f"분석 중 오류가 발생했습니다:\n{str(e)}")
+            self.write_result_text(f"오류 발생: {str(e)}\n")
     
-    def display_results(self, minima, maxima, method, max_count_limit, min_count_limit, max_threshold, min_threshold):
-        """분석 결과를 표시합니다."""
+    def show_analysis_result(self, result, y_hash, method, threshold, window_size,
+                             max_count_limit, min_count_limit, max_threshold, min_threshold):
+        """자동 탐지 결과에 임계값/개수 제한을 적용하고 결과 텍스트와 그래프에 반영합니다."""
+        minima, maxima = result
+        
+        # 모든 방법에 대해 임계값 필터링 적용
+        minima, maxima = self.apply_threshold_filter(minima, maxima, max_threshold, min_threshold)
+        
+        # 결과 필터링
+        minima, maxima = self.filter_results_by_count(minima, maxima, max_count_limit, min_count_limit, method)
+        
+        # 결과 저장
+        self.results = {
+            'minima': minima,
+            'maxima': maxima,
+            'method': method,
+            'file': self._file_basename
+        }
+        
+        # 결과 표시 (같은 데이터/설정이면 이전에 만든 텍스트를 그대로 사용)
+        render_key = (y_hash, self._file_basename, method, threshold, window_size,
+                      max_count_limit, min_count_limit, max_threshold, min_threshold)
+        if render_key != self._last_render_key:
+            self._last_render_text = self.format_results(minima, maxima, method, max_count_limit,
+                                                         min_count_limit, max_threshold, min_threshold)
+            self._last_render_key = render_key
+        self.write_result_text(self._last_render_text)
+        
+        # 그래프에 극값 표시
+        self.schedule_plot_extrema(minima, maxima)
+    
+    def format_results(self, minima, maxima, method, max_count_limit, min_count_limit, max_threshold, min_threshold):
+        """분석 결과 텍스트를 만듭니다."""
         # 탐지기 정보 가져오기
         detector_info = self.detector.get_detection_info()
         data_stats = detector_info.get('data_stats', {})
         
-        result_text = f"""
+        parts = [f"""
 === 분석 결과 ===
-파일: {os.path.basename(self.current_file_path)}
-데이터 개수: {len(self.data)}개
+파일: {self._file_basename}
+데이터 개수: {self._y_arr.size}개
 탐지 방법: {method} {'(자동 선택)' if method == 'auto' else '(수동 선택)'}
 최대값 개수 제한: {max_count_limit if max_count_limit > 0 else '제한 없음'}개
 최소값 개수 제한: {min_count_limit if min_count_limit > 0 else '제한 없음'}개
@@ -848,89 +1329,57 @@ class LocalExtremaGUI:
 평평한 구간: {'예' if data_stats.get('has_plateaus', False) else '아니오'}
 
 === 발견된 극값 ===
-로컬 최대값: {len(maxima)}개
-로컬 최소값: {len(minima)}개
+로컬 최대값: {maxima.idx.size}개
+로컬 최소값: {minima.idx.size}개
 
 === 로컬 최대값들 ===
-"""
+"""]
         
-        if maxima:
-            for i, (idx, val) in enumerate(maxima, 1):
-                result_text += f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+        if maxima.idx.size:
+            parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                         for i, (idx, val) in enumerate(maxima.to_pairs(), 1))
         else:
-            result_text += "발견된 최대값이 없습니다.\n"
+            parts.append("발견된 최대값이 없습니다.\n")
         
-        result_text += "\n=== 로컬 최소값들 ===\n"
+        parts.append("\n=== 로컬 최소값들 ===\n")
         
-        if minima:
-            for i, (idx, val) in enumerate(minima, 1):
-                result_text += f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+        if minima.idx.size:
+            parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                         for i, (idx, val) in enumerate(minima.to_pairs(), 1))
         else:
-            result_text += "발견된 최소값이 없습니다.\n"
+            parts.append("발견된 최소값이 없습니다.\n")
         
         # 데이터 통계
-        result_text += f"""
+        parts.append(f"""
 === 데이터 통계 ===
-전체 최대값: {max(self.data):.8f}
-전체 최소값: {min(self.data):.8f}
-전체 평균값: {sum(self.data)/len(self.data):.8f}
-"""
+전체 최대값: {self._y_max:.8f}
+전체 최소값: {self._y_min:.8f}
+전체 평균값: {self._y_arr.mean():.8f}
+""")
         
-        self.result_text.insert(tk.END, result_text)
+        return ''.join(parts)
     
     def find_extrema_around_selections(self):
         """선택된 점들을 기반으로 인근 극값을 탐지합니다."""
-        minima = []
-        maxima = []
-        
-        # 선택된 최대값 주변에서 실제 최대값 찾기
-        for selected_idx, selected_x, selected_y in self.selected_maxima:
-            # 주변 윈도우에서 최대값 찾기
-            window_size = 10  # 주변 10개 점 확인
-            start_idx = max(0, selected_idx - window_size)
-            end_idx = min(len(self.data), selected_idx + window_size + 1)
-            
-            local_max_idx = selected_idx
-            local_max_val = self.data[selected_idx]
-            
-            # 주변에서 실제 최대값 찾기
-            for i in range(start_idx, end_idx):
-                if self.data[i] > local_max_val:
-                    local_max_idx = i
-                    local_max_val = self.data[i]
-            
-            # 최대값으로 추가
-            if (local_max_idx, local_max_val) not in maxima:
-                maxima.append((local_max_idx, local_max_val))
-        
-        # 선택된 최소값 주변에서 실제 최소값 찾기
-        for selected_idx, selected_x, selected_y in self.selected_minima:
-            # 주변 윈도우에서 최소값 찾기
-            window_size = 10  # 주변 10개 점 확인
-            start_idx = max(0, selected_idx - window_size)
-            end_idx = min(len(self.data), selected_idx + window_size + 1)
-            
-            local_min_idx = selected_idx
-            local_min_val = self.data[selected_idx]
-            
-            # 주변에서 실제 최소값 찾기
-            for i in range(start_idx, end_idx):
-                if self.data[i] < local_min_val:
-                    local_min_idx = i
-                    local_min_val = self.data[i]
-            
-            # 최소값으로 추가
-            if (local_min_idx, local_min_val) not in minima:
-                minima.append((local_min_idx, local_min_val))
+        window_size = 10  # 주변 10개 점 확인
+        
+        max_sel = np.fromiter((idx for idx, _, _ in self.selected_maxima), dtype=np.int64,
+                              count=len(self.selected_maxima))
+        min_sel = np.fromiter((idx for idx, _, _ in self.selected_minima), dtype=np.int64,
+                              count=len(self.selected_minima))
+        
+        # 선택된 점 주변에서 실제 최대값/최소값 찾기
+        maxima = _refine_selections(self._y_arr, max_sel, window_size, find_max=True)
+        minima = _refine_selections(self._y_arr, min_sel, window_size, find_max=False)
         
         return minima, maxima
     
     def display_manual_results(self, minima, maxima):
         """수동 선택 모드의 분석 결과를 표시합니다."""
-        result_text = f"""
+        parts = [f"""
 === 수동 선택 모드 분석 결과 ===
-파일: {os.path.basename(self.current_file_path)}
-데이터 개수: {len(self.data)}개
+파일: {self._file_basename}
+데이터 개수: {self._y_arr.size}개
 탐지 방법: 수동 선택 + 인근 극값 탐지
 
 === 사용자 선택 ===
@@ -938,102 +1387,93 @@ class LocalExtremaGUI:
 선택된 최소값 후보: {len(self.selected_minima)}개
 
 === 발견된 극값 ===
-로컬 최대값: {len(maxima)}개
-로컬 최소값: {len(minima)}개
+로컬 최대값: {maxima.idx.size}개
+로컬 최소값: {minima.idx.size}개
 
 === 로컬 최대값들 ===
-"""
+"""]
         
-        if maxima:
-            for i, (idx, val) in enumerate(maxima, 1):
-                result_text += f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+        if maxima.idx.size:
+            parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                         for i, (idx, val) in enumerate(maxima.to_pairs(), 1))
         else:
-            result_text += "발견된 최대값이 없습니다.\n"
+            parts.append("발견된 최대값이 없습니다.\n")
         
-        result_text += "\n=== 로컬 최소값들 ===\n"
+        parts.append("\n=== 로컬 최소값들 ===\n")
         
-        if minima:
-            for i, (idx, val) in enumerate(minima, 1):
-                result_text += f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+        if minima.idx.size:
+            parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                         for i, (idx, val) in enumerate(minima.to_pairs(), 1))
         else:
-            result_text += "발견된 최소값이 없습니다.\n"
+            parts.append("발견된 최소값이 없습니다.\n")
         
         # 데이터 통계
-        result_text += f"""
+        parts.append(f"""
 === 데이터 통계 ===
-전체 최대값: {max(self.data):.8f}
-전체 최소값: {min(self.data):.8f}
-전체 평균값: {sum(self.data)/len(self.data):.8f}
-"""
+전체 최대값: {self._y_max:.8f}
+전체 최소값: {self._y_min:.8f}
+전체 평균값: {self._y_arr.mean():.8f}
+""")
         
-        self.result_text.insert(tk.END, result_text)
+        self.write_result_text(''.join(parts))
     
     def calculate_differences(self):
         """최대값과 최소값의 차이를 계산합니다."""
-        if not self.results or not self.results.get('maxima') or not self.results.get('minima'):
+        if not self.results or not self.results['maxima'].idx.size or not self.results['minima'].idx.size:
             messagebox.showwarning("경고", "먼저 분석을 실행하여 최대값과 최소값을 구해주세요.")
             return
         
-        maxima = self.results['maxima']
-        minima = self.results['minima']
-        
-        # 최대값과 최소값을 인덱스 순으로 정렬
-        maxima_sorted = sorted(maxima, key=lambda x: x[0])  # 인덱스 기준 정렬
-        minima_sorted = sorted(minima, key=lambda x: x[0])  # 인덱스 기준 정렬
-        
-        # 차이값 계산
-        self.difference_results = []
-        min_len = min(len(maxima_sorted), len(minima_sorted))
+        # 최대값과 최소값을 인덱스 순으로 정렬 (분석 결과마다 한 번만 정렬해 둠)
+        if 'maxima_sorted' not in self.results:
+            self.results['maxima_sorted'] = _sorted_by_index(self.results['maxima'])
+            self.results['minima_sorted'] = _sorted_by_index(self.results['minima'])
+        maxima_sorted = self.results['maxima_sorted']
+        minima_sorted = self.results['minima_sorted']
         
-        for i in range(min_len):
-            max_idx, max_val = maxima_sorted[i]
-            min_idx, min_val = minima_sorted[i]
-            difference = max_val - min_val
-            
-            self.difference_results.append({
-                'pair_number': i + 1,
-                'max_index': max_idx,
-                'max_value': max_val,
-                'min_index': min_idx,
-                'min_value': min_val,
-                'difference': difference
-            })
+        # 차이값 계산 (i번째 최대값과 i번째 최소값을 짝지음)
+        min_len = min(maxima_sorted.idx.size, minima_sorted.idx.size)
+        max_val = maxima_sorted.val[:min_len]
+        min_val = minima_sorted.val[:min_len]
+        self.difference_results = DifferencePairs(maxima_sorted.idx[:min_len], max_val,
+                                                  minima_sorted.idx[:min_len], min_val, max_val - min_val)
         
         # 결과 표시
         self.display_difference_results()
         
-        messagebox.showinfo("성공", f"{len(self.difference_results)}개의 차이값이 계산되었습니다.")
+        messagebox.showinfo("성공", f"{self.difference_results.diff.size}개의 차이값이 계산되었습니다.")
     
     def display_difference_results(self):
         """차이값 계산 결과를 표시합니다."""
-        if not self.difference_results:
+        if not self.difference_results.diff.size:
             return
         
-        result_text = f"""
+        parts = [f"""
 === 차이값 계산 결과 ===
-총 {len(self.difference_results)}개의 최대값-최소값 쌍이 계산되었습니다.
+총 {self.difference_results.diff.size}개의 최대값-최소값 쌍이 계산되었습니다.
 
-"""
+"""]
         
-        for result in self.difference_results:
-            result_text += f"쌍 {result['pair_number']:2d}: 최대값({result['max_index']:4d}, {result['max_value']:10.6f}) - 최소값({result['min_index']:4d}, {result['min_value']:10.6f}) = {result['difference']:10.6f}\n"
+        parts.extend(
+            f"쌍 {pair:2d}: 최대값({max_idx:4d}, {max_val:10.6f}) - 최소값({min_idx:4d}, {min_val:10.6f}) = {diff:10.6f}\n"
+            for pair, max_idx, max_val, min_idx, min_val, diff in self.difference_results.rows()
+        )
         
         # 통계 정보
-        differences = [r['difference'] for r in self.difference_results]
-        result_text += f"""
+        differences = self.difference_results.diff
+        parts.append(f"""
 === 차이값 통계 ===
-평균 차이값: {sum(differences)/len(differences):.6f}
-최대 차이값: {max(differences):.6f}
-최소 차이값: {min(differences):.6f}
-차이값 표준편차: {(sum([(d - sum(differences)/len(differences))**2 for d in differences]) / len(differences))**0.5:.6f}
+평균 차이값: {differences.mean():.6f}
+최대 차이값: {differences.max():.6f}
+최소 차이값: {differences.min():.6f}
+차이값 표준편차: {differences.std():.6f}
 
-"""
+""")
         
-        self.result_text.insert(tk.END, result_text)
+        self.write_result_text(''.join(parts))
     
     def save_differences(self):
         """차이값 계산 결과를 파일로 저장합니다."""
-        if not self.difference_results:
+        if not self.difference_results.diff.size:
             messagebox.showwarning("경고", "저장할 차이값 결과가 없습니다. 먼저 '차이값 계산' 버튼을 클릭해주세요.")
             return
         
@@ -1051,32 +1491,29 @@ class LocalExtremaGUI:
                     with open(file_path, 'w', newline='', encoding='utf-8') as f:
                         writer = csv.writer(f)
                         writer.writerow(['쌍 번호', '최대값 인덱스', '최대값', '최소값 인덱스', '최소값', '차이값'])
-                        for result in self.difference_results:
-                            writer.writerow([
-                                result['pair_number'],
-                                result['max_index'],
-                                result['max_value'],
-                                result['min_index'],
-                                result['min_value'],
-                                result['difference']
-                            ])
+                        writer.writerows(self.difference_results.rows())
                 else:
                     # 텍스트 형식으로 저장
+                    # 전체 내용을 문자열 조각으로 모은 뒤 한 번에 기록
+                    parts = ["=== 최대값-최소값 차이값 계산 결과 ===\n",
+                             f"파일: {self._file_basename}\n",
+                             f"총 쌍 개수: {self.difference_results.diff.size}개\n\n"]
+                    
+                    parts.extend(f"쌍 {pair:2d}: 최대값({max_idx:4d}, {max_val:10.6f}) - 최소값({min_idx:4d}, {min_val:10.6f}) = {diff:10.6f}\n"
+                                 for pair, max_idx, max_val, min_idx, min_val, diff in self.difference_results.rows())
+                    
+                    # 통계 정보
+                    differences = self.difference_results.diff
+                    parts.append(f"""
+=== 차이값 통계 ===
+평균 차이값: {differences.mean():.6f}
+최대 차이값: {differences.max():.6f}
+최소 차이값: {differences.min():.6f}
+차이값 표준편차: {differences.std():.6f}
+""")
+                    
                     with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write("=== 최대값-최소값 차이값 계산 결과 ===\n")
-                        f.write(f"파일: {os.path.basename(self.current_file_path)}\n")
-                        f.write(f"총 쌍 개수: {len(self.difference_results)}개\n\n")
-                        
-                        for result in self.difference_results:
-                            f.write(f"쌍 {result['pair_number']:2d}: 최대값({result['max_index']:4d}, {result['max_value']:10.6f}) - 최소값({result['min_index']:4d}, {result['min_value']:10.6f}) = {result['difference']:10.6f}\n")
-                        
-                        # 통계 정보
-                        differences = [r['difference'] for r in self.difference_results]
-                        f.write(f"\n=== 차이값 통계 ===\n")
-                        f.write(f"평균 차이값: {sum(differences)/len(differences):.6f}\n")
-                        f.write(f"최대 차이값: {max(differences):.6f}\n")
-                        f.write(f"최소 차이값: {min(differences):.6f}\n")
-                        f.write(f"차이값 표준편차: {(sum([(d - sum(differences)/len(differences))**2 for d in differences]) / len(differences))**0.5:.6f}\n")
+                        f.write(''.join(parts))
                 
                 messagebox.showinfo("성공", f"차이값 결과가 저장되었습니다:\n{file_path}")
                 
@@ -1097,22 +1534,27 @@ class LocalExtremaGUI:
         
         if file_path:
             try:
+                # 전체 내용을 문자열 조각으로 모은 뒤 한 번에 기록
+                parts = [f"""=== 로컬 극값 탐지 결과 ===
+파일: {self.results['file']}
+탐지 방법: {self.results['method']}
+로컬 최대값 개수: {self.results['maxima'].idx.size}
+로컬 최소값 개수: {self.results['minima'].idx.size}
+
+"""]
+                
+                if self.results['maxima'].idx.size:
+                    parts.append("로컬 최대값들:\n")
+                    parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                                 for i, (idx, val) in enumerate(self.results['maxima'].to_pairs(), 1))
+                
+                if self.results['minima'].idx.size:
+                    parts.append("\n로컬 최소값들:\n")
+                    parts.extend(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n"
+                                 for i, (idx, val) in enumerate(self.results['minima'].to_pairs(), 1))
+                
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"=== 로컬 극값 탐지 결과 ===\n")
-                    f.write(f"파일: {self.results['file']}\n")
-                    f.write(f"탐지 방법: {self.results['method']}\n")
-                    f.write(f"로컬 최대값 개수: {len(self.results['maxima'])}\n")
-                    f.write(f"로컬 최소값 개수: {len(self.results['minima'])}\n\n")
-                    
-                    if self.results['maxima']:
-                        f.write("로컬 최대값들:\n")
-                        for i, (idx, val) in enumerate(self.results['maxima'], 1):
-                            f.write(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n")
-                    
-                    if self.results['minima']:
-                        f.write("\n로컬 최소값들:\n")
-                        for i, (idx, val) in enumerate(self.results['minima'], 1):
-                            f.write(f"{i:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n")
+                    f.write(''.join(parts))
                 
                 messagebox.showinfo("성공", f"결과가 저장되었습니다:\n{file_path}")
                 
@@ -1121,13 +1563,12 @@ class LocalExtremaGUI:
     
     def clear_results(self):
         """결과를 지웁니다."""
-        self.result_text.delete(1.0, tk.END)
         self.results = {}
-        self.difference_results = []  # 차이값 결과도 초기화
+        self.difference_results = DifferencePairs.empty()  # 차이값 결과도 초기화
         
-        # 그래프도 원본 데이터로 초기화
-        if self.x_data and self.y_data:
-            self.plot_data()
+        # 그래프의 극값 표시만 지움 (데이터 선은 이미 그려져 있으므로 다시 그리지 않음)
+        if self._y_arr.size:
+            self.clear_extrema_display()
         
         self.show_initial_message()
 
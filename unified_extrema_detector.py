@@ -5,9 +5,120 @@
 모든 탐지 방법을 하나로 통합하여 데이터 특성에 따라 자동으로 최적의 방법을 선택합니다.
 """
 
+import array
+import bisect
 import numpy as np
+from collections import namedtuple
 from typing import List, Tuple, Dict, Optional
 import os
+import warnings
+
+
+class Extrema(namedtuple('Extrema', ['idx', 'val'])):
+    """
+    극값 목록을 인덱스 배열과 값 배열로 나누어 저장하는 SoA 구조
+    
+    [(인덱스, 값), ...] 튜플 리스트 대신 두 개의 ndarray를 사용하여
+    필터링, 정렬, 그래프 표시를 배열 연산으로 처리할 수 있게 합니다.
+    """
+    __slots__ = ()
+    
+    @classmethod
+    def from_pairs(cls, pairs: List[Tuple[int, float]]) -> 'Extrema':
+        """[(인덱스, 값), ...] 리스트로부터 생성합니다."""
+        idx = np.fromiter((i for i, _ in pairs), dtype=np.int64, count=len(pairs))
+        val = np.fromiter((v for _, v in pairs), dtype=np.float64, count=len(pairs))
+        return cls(idx, val)
+    
+    def to_pairs(self) -> List[Tuple[int, float]]:
+        """[(인덱스, 값), ...] 리스트로 변환합니다."""
+        return list(zip(self.idx.tolist(), self.val.tolist()))
+
+
+def _simple_extrema_masks(arr: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    단순 방법의 최대값/최소값 여부를 arr[1:-1]의 각 점에 대한 불리언 마스크로 구합니다.
+    """
+    prev_vals = arr[:-2]
+    curr_vals = arr[1:-1]
+    next_vals = arr[2:]
+    
+    # 최대값: 이전 값보다 크고, 다음 값보다 크거나 같음
+    max_mask = (curr_vals > prev_vals + threshold) & (curr_vals >= next_vals - threshold)
+    # 최소값: 이전 값보다 작고, 다음 값보다 작거나 같음
+    min_mask = (curr_vals < prev_vals - threshold) & (curr_vals <= next_vals + threshold) & ~max_mask
+    return max_mask, min_mask
+
+
+def _merge_by_index(arr: np.ndarray, max_idx: np.ndarray,
+                    min_idx: np.ndarray) -> List[Tuple[str, int, float]]:
+    """
+    최대값/최소값 후보 인덱스를 인덱스 순으로 합쳐 [('max' 또는 'min', 인덱스, 값), ...]로 반환합니다.
+    
+    같은 인덱스면 최대값이 먼저 옵니다 (안정 정렬).
+    """
+    all_idx = np.concatenate((max_idx, min_idx))
+    order = np.argsort(all_idx, kind='stable')
+    all_idx = all_idx[order]
+    is_max = order < len(max_idx)
+    
+    type_names = ('min', 'max')
+    return [(type_names[m], idx, val)
+            for m, idx, val in zip(is_max.tolist(), all_idx.tolist(), arr[all_idx].tolist())]
+
+
+def _dedupe_by_index(extrema: Extrema) -> Extrema:
+    """같은 인덱스가 여러 번 있으면 마지막 값만 남기고 인덱스 순으로 정렬합니다."""
+    # 탐지 결과는 대부분 이미 중복 없이 정렬되어 있으므로 그대로 반환
+    if np.all(np.diff(extrema.idx) > 0):
+        return extrema
+    
+    # 뒤집은 배열에서 각 인덱스의 첫 위치 = 원래 배열에서 마지막 위치
+    idx, last = np.unique(extrema.idx[::-1], return_index=True)
+    return Extrema(idx, extrema.val[::-1][last])
+
+
+def _rolling_max(arr: np.ndarray, size: int) -> np.ndarray:
+    """
+    길이 size인 모든 연속 구간의 최대값을 구합니다 (결과 길이: len(arr) - size + 1).
+    
+    van Herk/Gil-Werman 방식으로 size 단위 블록의 앞쪽/뒤쪽 누적 최대값을 한 번씩만 계산하므로
+    윈도우 크기와 관계없이 원소당 비교 횟수가 일정합니다.
+    """
+    n = len(arr)
+    n_blocks = -(-n // size)
+    padded = np.full(n_blocks * size, -np.inf)
+    padded[:n] = arr
+    blocks = padded.reshape(n_blocks, size)
+    
+    # 각 구간 [i, i + size)는 블록 경계를 최대 한 번 넘으므로 두 누적값의 최대가 구간 최대
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[:n - size + 1], prefix[size - 1:n])
+
+
+def _neighborhood_candidates(arr: np.ndarray, radius: int,
+                             min_threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    좌우 radius개 이웃 모두보다 엄격히 큰/작은 점의 인덱스를 구합니다.
+    
+    최소값 후보는 min_threshold 이하인 점으로 제한합니다. 이웃 비교를 원소별 루프 대신
+    이동한 슬라이스끼리의 비교로 수행합니다 (NaN 비교 결과도 원소별 루프와 같음).
+    """
+    n = len(arr)
+    centers = arr[radius:n - radius]
+    not_max = np.zeros(centers.shape, dtype=bool)
+    not_min = centers > min_threshold
+    for offset in range(-radius, radius + 1):
+        if offset == 0:
+            continue
+        neighbors = arr[radius + offset:n - radius + offset]
+        not_max |= neighbors >= centers
+        not_min |= neighbors <= centers
+    
+    max_idx = np.flatnonzero(~not_max) + radius
+    min_idx = np.flatnonzero(~not_min) + radius
+    return max_idx, min_idx
 
 
 class UnifiedExtremaDetector:
@@ -39,7 +150,7 @@ class UnifiedExtremaDetector:
         Returns:
             데이터 특성 정보 딕셔너리
         """
-        if not data:
+        if len(data) == 0:
             return {}
         
         data_array = np.array(data)
@@ -48,7 +159,8 @@ class UnifiedExtremaDetector:
         min_val = np.min(data_array)
         max_val = np.max(data_array)
         mean_val = np.mean(data_array)
-        std_val = np.std(data_array)
+        # np.std와 같은 계산이지만 위에서 구한 평균을 재사용하여 합계 계산을 한 번 줄임
+        std_val = np.sqrt(np.mean(np.square(data_array - mean_val)))
         range_val = max_val - min_val
         
         # 데이터 길이
@@ -61,14 +173,18 @@ class UnifiedExtremaDetector:
         # 데이터의 변동성 (전체 범위 대비 표준편차 비율)
         variability = std_val / range_val if range_val > 0 else 0
         
-        # 극값 밀도 추정 (간단한 방법으로 예비 극값 개수 계산)
-        simple_extrema = self._detect_simple(data, threshold=noise_level * 0.1)
-        estimated_extrema_count = len(simple_extrema[0]) + len(simple_extrema[1])
+        # 극값 밀도 추정 (간단한 방법으로 예비 극값 개수 계산, 목록은 만들지 않고 개수만 셈)
+        if data_length >= 3:
+            max_mask, min_mask = _simple_extrema_masks(data_array.astype(np.float64, copy=False), noise_level * 0.1)
+            estimated_extrema_count = int(np.count_nonzero(max_mask)) + int(np.count_nonzero(min_mask))
+        else:
+            estimated_extrema_count = 0
         extrema_density = estimated_extrema_count / data_length if data_length > 0 else 0
         
         # 데이터 패턴 분석
-        is_oscillatory = self._is_oscillatory_pattern(data_array)
-        has_plateaus = self._has_plateaus(data_array, noise_level)
+        # 위에서 계산한 차이값을 함께 넘겨 np.diff를 다시 계산하지 않음
+        is_oscillatory = self._is_oscillatory_pattern(data_array, diffs)
+        has_plateaus = self._has_plateaus(data_array, noise_level, diffs)
         
         characteristics = {
             'length': data_length,
@@ -88,36 +204,36 @@ class UnifiedExtremaDetector:
         self.data_stats = characteristics
         return characteristics
     
-    def _is_oscillatory_pattern(self, data: np.ndarray) -> bool:
-        """데이터가 진동 패턴을 보이는지 확인합니다."""
+    def _is_oscillatory_pattern(self, data: np.ndarray, diffs: Optional[np.ndarray] = None) -> bool:
+        """데이터가 진동 패턴을 보이는지 확인합니다 (diffs: 미리 계산한 np.diff(data))."""
         if len(data) < 10:
             return False
         
         # 기울기의 부호 변화 빈도 계산
-        diffs = np.diff(data)
+        if diffs is None:
+            diffs = np.diff(data)
         sign_changes = np.sum(np.diff(np.sign(diffs)) != 0)
         change_rate = sign_changes / len(diffs) if len(diffs) > 0 else 0
         
         return change_rate > 0.3  # 30% 이상의 부호 변화가 있으면 진동 패턴
     
-    def _has_plateaus(self, data: np.ndarray, noise_level: float) -> bool:
-        """데이터에 평평한 구간(plateau)이 있는지 확인합니다."""
+    def _has_plateaus(self, data: np.ndarray, noise_level: float, diffs: Optional[np.ndarray] = None) -> bool:
+        """데이터에 평평한 구간(plateau)이 있는지 확인합니다 (diffs: 미리 계산한 np.diff(data))."""
         if len(data) < 5:
             return False
         
         # 연속된 값들이 비슷한 구간이 있는지 확인
-        diffs = np.abs(np.diff(data))
+        if diffs is None:
+            diffs = np.diff(data)
+        diffs = np.abs(diffs)
         plateau_threshold = noise_level * 0.5
         
-        consecutive_similar = 0
-        max_consecutive = 0
-        
-        for diff in diffs:
-            if diff < plateau_threshold:
-                consecutive_similar += 1
-                max_consecutive = max(max_consecutive, consecutive_similar)
-            else:
-                consecutive_similar = 0
+        # 비슷한 값이 이어지는 구간의 시작/끝을 찾아 가장 긴 구간 길이 계산
+        similar = np.concatenate(([False], diffs < plateau_threshold, [False]))
+        edges = np.diff(similar.astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        max_consecutive = int((ends - starts).max()) if starts.size else 0
         
         return max_consecutive >= 5  # 5개 이상 연속으로 비슷한 값이 있으면 plateau
     
@@ -166,6 +282,7 @@ class UnifiedExtremaDetector:
         return 'enhanced'
     
     def detect_extrema(self, data: List[float], method: Optional[str] = None, 
+                      characteristics: Optional[Dict] = None,
                       **kwargs) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
         """
         통합된 극값 탐지 메인 함수
@@ -173,16 +290,24 @@ class UnifiedExtremaDetector:
         Args:
             data: 분석할 데이터
             method: 사용할 탐지 방법 (None이면 자동 선택)
+            characteristics: 같은 데이터에 대해 미리 계산한 analyze_data_characteristics 결과
+                             (None이면 새로 분석)
             **kwargs: 각 방법별 추가 파라미터
             
         Returns:
             (minima, maxima) 튜플
         """
-        if not data or len(data) < 3:
+        if len(data) < 3:
             return [], []
         
-        # 데이터 특성 분석
-        characteristics = self.analyze_data_characteristics(data)
+        # 모든 탐지 방법이 같은 float64 배열을 공유하도록 한 번만 변환
+        data = np.asarray(data, dtype=np.float64)
+        
+        # 데이터 특성 분석 (미리 계산된 결과가 있으면 재사용)
+        if characteristics is None:
+            characteristics = self.analyze_data_characteristics(data)
+        else:
+            self.data_stats = characteristics
         
         # 탐지 방법 선택
         if method is None:
@@ -200,52 +325,44 @@ class UnifiedExtremaDetector:
         
         return minima, maxima
     
-    def _detect_simple(self, data: List[float], threshold: float = 0.0001) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
+    def _detect_simple(self, data: List[float], threshold: float = 0.0001, **kwargs) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
         """단순한 방법으로 로컬 극값을 찾습니다."""
         if len(data) < 3:
             return [], []
         
-        minima = []
-        maxima = []
+        # 이웃 비교를 원소별 루프 대신 배열 연산 한 번으로 수행
+        arr = np.asarray(data, dtype=np.float64)
+        max_mask, min_mask = _simple_extrema_masks(arr, threshold)
         
-        for i in range(1, len(data) - 1):
-            prev_val = data[i-1]
-            curr_val = data[i]
-            next_val = data[i+1]
-            
-            # 최대값: 이전 값보다 크고, 다음 값보다 크거나 같음
-            if curr_val > prev_val + threshold and curr_val >= next_val - threshold:
-                maxima.append((i, curr_val))
-            # 최소값: 이전 값보다 작고, 다음 값보다 작거나 같음
-            elif curr_val < prev_val - threshold and curr_val <= next_val + threshold:
-                minima.append((i, curr_val))
+        max_idx = np.flatnonzero(max_mask) + 1
+        min_idx = np.flatnonzero(min_mask) + 1
+        
+        maxima = list(zip(max_idx.tolist(), arr[max_idx].tolist()))
+        minima = list(zip(min_idx.tolist(), arr[min_idx].tolist()))
         
         return minima, maxima
     
     def _detect_window(self, data: List[float], window_size: int = 3, threshold: float = 0.0001, **kwargs) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
         """윈도우 기반 방법으로 로컬 극값을 찾습니다."""
-        if len(data) < window_size + 2:
+        if len(data) < window_size + 2 or len(data) < 2 * window_size + 1:
             return [], []
         
-        minima = []
-        maxima = []
+        # 각 점을 중심으로 한 (2 * window_size + 1) 크기 윈도우의 최대/최소를 O(N)으로 계산
+        arr = np.asarray(data, dtype=np.float64)
+        size = 2 * window_size + 1
+        window_max = _rolling_max(arr, size)
+        window_min = -_rolling_max(-arr, size)
+        centers = arr[window_size:len(arr) - window_size]
         
-        for i in range(window_size, len(data) - window_size):
-            current_value = data[i]
-            
-            left_window = data[i-window_size:i]
-            right_window = data[i+1:i+window_size+1]
-            
-            # 로컬 최대값인지 확인
-            is_local_max = all(current_value >= val for val in left_window + right_window)
-            
-            # 로컬 최소값인지 확인
-            is_local_min = all(current_value <= val for val in left_window + right_window)
-            
-            if is_local_max:
-                maxima.append((i, current_value))
-            elif is_local_min:
-                minima.append((i, current_value))
+        # 중심값은 자기 자신과의 비교가 항상 참이므로 윈도우 전체의 최대/최소와 비교해도 같음
+        max_mask = centers >= window_max
+        min_mask = (centers <= window_min) & ~max_mask
+        
+        max_idx = np.flatnonzero(max_mask) + window_size
+        min_idx = np.flatnonzero(min_mask) + window_size
+        
+        maxima = list(zip(max_idx.tolist(), arr[max_idx].tolist()))
+        minima = list(zip(min_idx.tolist(), arr[min_idx].tolist()))
         
         return minima, maxima
     
@@ -255,28 +372,23 @@ class UnifiedExtremaDetector:
             return [], []
         
         # 기울기 계산
-        slopes = []
-        for i in range(len(data) - 1):
-            slope = data[i+1] - data[i]
-            slopes.append(slope)
-        
-        minima = []
-        maxima = []
-        
-        # 기울기의 부호 변화를 찾아서 극값 탐지
-        for i in range(1, len(slopes) - 1):
-            prev_slope = slopes[i-1]
-            curr_slope = slopes[i]
-            
-            if abs(curr_slope) < threshold:
-                continue
-            
-            # 양에서 음으로 변하면 최대값
-            if prev_slope > threshold and curr_slope < -threshold:
-                maxima.append((i, data[i]))
-            # 음에서 양으로 변하면 최소값
-            elif prev_slope < -threshold and curr_slope > threshold:
-                minima.append((i, data[i]))
+        arr = np.asarray(data, dtype=np.float64)
+        slopes = np.diff(arr)
+        
+        # 기울기의 부호 변화를 찾아서 극값 탐지 (마지막 기울기는 비교하지 않음)
+        prev_slopes = slopes[:-2]
+        curr_slopes = slopes[1:-1]
+        
+        # 양에서 음으로 변하면 최대값
+        max_mask = (prev_slopes > threshold) & (curr_slopes < -threshold)
+        # 음에서 양으로 변하면 최소값
+        min_mask = (prev_slopes < -threshold) & (curr_slopes > threshold) & ~max_mask
+        
+        max_idx = np.flatnonzero(max_mask) + 1
+        min_idx = np.flatnonzero(min_mask) + 1
+        
+        maxima = list(zip(max_idx.tolist(), arr[max_idx].tolist()))
+        minima = list(zip(min_idx.tolist(), arr[min_idx].tolist()))
         
         return minima, maxima
     
@@ -285,40 +397,30 @@ class UnifiedExtremaDetector:
         if len(data) < 5:
             return [], []
         
-        # 먼저 모든 극값을 찾기
-        all_maxima = []
-        all_minima = []
+        # 먼저 모든 극값을 찾기 (앞뒤 두 점씩과의 비교를 배열 연산으로 한 번에 수행)
+        arr = np.asarray(data, dtype=np.float64)
+        curr_vals = arr[2:-2]
         
-        for i in range(2, len(data) - 2):
-            prev_val = data[i-1]
-            curr_val = data[i]
-            next_val = data[i+1]
-            
-            # 최대값 확인 (더 엄격한 조건)
-            if (curr_val > prev_val + threshold and 
-                curr_val > next_val + threshold and
-                curr_val > data[i-2] + threshold and
-                curr_val > data[i+2] + threshold):
-                all_maxima.append((i, curr_val))
-            
-            # 최소값 확인 (더 엄격한 조건)
-            elif (curr_val < prev_val - threshold and 
-                  curr_val < next_val - threshold and
-                  curr_val < data[i-2] - threshold and
-                  curr_val < data[i+2] - threshold):
-                all_minima.append((i, curr_val))
+        # 최대값 확인 (더 엄격한 조건)
+        max_mask = ((curr_vals > arr[1:-3] + threshold) &
+                    (curr_vals > arr[3:-1] + threshold) &
+                    (curr_vals > arr[:-4] + threshold) &
+                    (curr_vals > arr[4:] + threshold))
+        
+        # 최소값 확인 (더 엄격한 조건)
+        min_mask = ((curr_vals < arr[1:-3] - threshold) &
+                    (curr_vals < arr[3:-1] - threshold) &
+                    (curr_vals < arr[:-4] - threshold) &
+                    (curr_vals < arr[4:] - threshold) & ~max_mask)
+        
+        max_idx = np.flatnonzero(max_mask) + 2
+        min_idx = np.flatnonzero(min_mask) + 2
         
         # 교차 패턴으로 정렬
         extrema = []
         
         # 모든 극값을 인덱스 순으로 정렬
-        all_extrema = []
-        for idx, val in all_maxima:
-            all_extrema.append(('max', idx, val))
-        for idx, val in all_minima:
-            all_extrema.append(('min', idx, val))
-        
-        all_extrema.sort(key=lambda x: x[1])  # 인덱스 순으로 정렬
+        all_extrema = _merge_by_index(arr, max_idx, min_idx)
         
         # 교차 패턴 적용
         for typ, idx, val in all_extrema:
@@ -348,53 +450,23 @@ class UnifiedExtremaDetector:
         if len(data) < 7:
             return [], []
         
-        # 데이터의 전체 범위 파악
-        min_val = min(data)
-        max_val = max(data)
+        arr = np.asarray(data, dtype=np.float64)
+        
+        # 데이터의 전체 범위 파악 (NaN은 제외하고 계산)
+        min_val = float(np.nanmin(arr))
+        max_val = float(np.nanmax(arr))
         data_range = max_val - min_val
         
         # 최소값 임계값: 0.4 이하 또는 전체 범위의 30% 이하
         min_threshold = min(0.4, min_val + data_range * 0.3)
         
         # 1단계: 모든 잠재적 극값 찾기
-        potential_maxima = []
-        potential_minima = []
+        # 최대값 후보: 주변 3개씩 모두보다 큼
+        # 최소값 후보: 주변 3개씩 모두보다 작고, 임계값 이하
+        max_idx, min_idx = _neighborhood_candidates(arr, 3, min_threshold)
         
-        for i in range(3, len(data) - 3):
-            curr_val = data[i]
-            
-            # 최대값 후보: 주변 3개씩 모두보다 큼
-            is_max = True
-            for j in range(i-3, i+4):
-                if j != i and data[j] >= curr_val:
-                    is_max = False
-                    break
-            
-            if is_max:
-                potential_maxima.append((i, curr_val))
-            
-            # 최소값 후보: 주변 3개씩 모두보다 작고, 임계값 이하
-            is_min = True
-            if curr_val > min_threshold:
-                is_min = False
-            else:
-                for j in range(i-3, i+4):
-                    if j != i and data[j] <= curr_val:
-                        is_min = False
-                        break
-            
-            if is_min:
-                potential_minima.append((i, curr_val))
-        
-        # 2단계: 교차 패턴으로 정렬
-        all_extrema = []
-        for idx, val in potential_maxima:
-            all_extrema.append(('max', idx, val))
-        for idx, val in potential_minima:
-            all_extrema.append(('min', idx, val))
-        
-        # 인덱스 순으로 정렬
-        all_extrema.sort(key=lambda x: x[1])
+        # 2단계: 교차 패턴으로 정렬 (인덱스 순)
+        all_extrema = _merge_by_index(arr, max_idx, min_idx)
         
         # 3단계: 교차 패턴 적용 및 충분한 변화 확인
         final_extrema = []
@@ -432,53 +504,18 @@ class UnifiedExtremaDetector:
         if len(data) < 7:
             return [], []
         
-        # 데이터의 전체 범위 파악
-        min_val = min(data)
-        max_val = max(data)
-        data_range = max_val - min_val
+        arr = np.asarray(data, dtype=np.float64)
         
         # 최소값 임계값: 0.4 고정
         min_threshold = 0.4
         
         # 1단계: 모든 잠재적 극값 찾기
-        potential_maxima = []
-        potential_minima = []
+        # 최대값 후보: 주변 3개씩 모두보다 큼
+        # 최소값 후보: 주변 3개씩 모두보다 작고, 반드시 0.4 이하
+        max_idx, min_idx = _neighborhood_candidates(arr, 3, min_threshold)
         
-        for i in range(3, len(data) - 3):
-            curr_val = data[i]
-            
-            # 최대값 후보: 주변 3개씩 모두보다 큼
-            is_max = True
-            for j in range(i-3, i+4):
-                if j != i and data[j] >= curr_val:
-                    is_max = False
-                    break
-            
-            if is_max:
-                potential_maxima.append((i, curr_val))
-            
-            # 최소값 후보: 주변 3개씩 모두보다 작고, 반드시 0.4 이하
-            is_min = True
-            if curr_val > min_threshold:
-                is_min = False  # 0.4보다 크면 절대 최소값이 될 수 없음
-            else:
-                for j in range(i-3, i+4):
-                    if j != i and data[j] <= curr_val:
-                        is_min = False
-                        break
-            
-            if is_min:
-                potential_minima.append((i, curr_val))
-        
-        # 2단계: 교차 패턴으로 정렬
-        all_extrema = []
-        for idx, val in potential_maxima:
-            all_extrema.append(('max', idx, val))
-        for idx, val in potential_minima:
-            all_extrema.append(('min', idx, val))
-        
-        # 인덱스 순으로 정렬
-        all_extrema.sort(key=lambda x: x[1])
+        # 2단계: 교차 패턴으로 정렬 (인덱스 순)
+        all_extrema = _merge_by_index(arr, max_idx, min_idx)
         
         # 3단계: 교차 패턴 적용 및 엄격한 조건 확인
         final_extrema = []
@@ -526,13 +563,13 @@ class UnifiedExtremaDetector:
         Returns:
             후처리된 (minima, maxima) 튜플
         """
-        # 중복 제거 (같은 인덱스의 극값이 중복된 경우)
-        minima_dict = {idx: val for idx, val in minima}
-        maxima_dict = {idx: val for idx, val in maxima}
+        # 후처리는 인덱스/값 배열(SoA)로 수행하고 반환할 때만 튜플 리스트로 변환
+        minima = Extrema.from_pairs(minima)
+        maxima = Extrema.from_pairs(maxima)
         
-        # 인덱스 순으로 정렬
-        minima = sorted(minima_dict.items())
-        maxima = sorted(maxima_dict.items())
+        # 중복 제거 (같은 인덱스의 극값이 중복된 경우) 및 인덱스 순으로 정렬
+        minima = _dedupe_by_index(minima)
+        maxima = _dedupe_by_index(maxima)
         
         # 너무 가까운 극값들 제거 (최소 거리 조건)
         min_distance = max(2, len(data) // 100)  # 데이터 길이의 1% 또는 최소 2
@@ -546,53 +583,47 @@ class UnifiedExtremaDetector:
             minima = self._filter_by_quality(minima, data, noise_level, is_minimum=True)
             maxima = self._filter_by_quality(maxima, data, noise_level, is_minimum=False)
         
-        return minima, maxima
+        return minima.to_pairs(), maxima.to_pairs()
     
-    def _remove_close_extrema(self, extrema: List[Tuple[int, float]], min_distance: int) -> List[Tuple[int, float]]:
+    def _remove_close_extrema(self, extrema: Extrema, min_distance: int) -> Extrema:
         """너무 가까운 극값들을 제거합니다."""
-        if not extrema:
-            return []
+        if not extrema.idx.size:
+            return extrema
         
-        filtered = [extrema[0]]  # 첫 번째는 항상 유지
+        # 모든 간격이 충분하면 그대로 반환
+        if np.all(np.diff(extrema.idx) >= min_distance):
+            return extrema
         
-        for i in range(1, len(extrema)):
-            current_idx = extrema[i][0]
-            last_kept_idx = filtered[-1][0]
-            
-            if current_idx - last_kept_idx >= min_distance:
-                filtered.append(extrema[i])
+        # 정렬된 인덱스에서 마지막으로 유지한 극값보다 min_distance 이상 떨어진 첫 극값으로 바로 이동
+        indices = extrema.idx.tolist()
+        keep = [0]  # 첫 번째는 항상 유지
+        i = bisect.bisect_left(indices, indices[0] + min_distance)
+        
+        while i < len(indices):
+            keep.append(i)
+            i = bisect.bisect_left(indices, indices[i] + min_distance, i + 1)
         
-        return filtered
+        return Extrema(extrema.idx[keep], extrema.val[keep])
     
-    def _filter_by_quality(self, extrema: List[Tuple[int, float]], data: List[float], 
-                          noise_level: float, is_minimum: bool) -> List[Tuple[int, float]]:
+    def _filter_by_quality(self, extrema: Extrema, data: np.ndarray, 
+                          noise_level: float, is_minimum: bool) -> Extrema:
         """극값의 품질을 검증하여 필터링합니다."""
-        if not extrema:
-            return []
-        
-        filtered = []
-        
-        for idx, val in extrema:
-            # 주변 데이터와의 차이 계산
-            window_size = min(3, len(data) // 10)
-            start_idx = max(0, idx - window_size)
-            end_idx = min(len(data), idx + window_size + 1)
-            
-            local_data = data[start_idx:end_idx]
-            if not local_data:
-                continue
-            
-            # 극값이 주변 데이터와 충분히 다른지 확인
-            if is_minimum:
-                min_local = min(local_data)
-                if val <= min_local + noise_level * 2:  # 최소값인 경우
-                    filtered.append((idx, val))
-            else:
-                max_local = max(local_data)
-                if val >= max_local - noise_level * 2:  # 최대값인 경우
-                    filtered.append((idx, val))
+        if not extrema.idx.size:
+            return extrema
+        
+        # 각 극값 주변 (2 * window_size + 1)개 점을 한 번에 모음 (범위 밖은 끝 값으로 채워도 최대/최소는 같음)
+        data = np.asarray(data, dtype=np.float64)
+        window_size = min(3, len(data) // 10)
+        offsets = np.arange(-window_size, window_size + 1)
+        local_data = data[np.clip(extrema.idx[:, None] + offsets, 0, len(data) - 1)]
+        
+        # 극값이 주변 데이터와 충분히 다른지 확인
+        if is_minimum:
+            keep = extrema.val <= local_data.min(axis=1) + noise_level * 2  # 최소값인 경우
+        else:
+            keep = extrema.val >= local_data.max(axis=1) - noise_level * 2  # 최대값인 경우
         
-        return filtered
+        return Extrema(extrema.idx[keep], extrema.val[keep])
     
     def get_detection_info(self) -> Dict:
         """현재 탐지 설정 정보를 반환합니다."""
@@ -603,35 +634,51 @@ class UnifiedExtremaDetector:
         }
 
 
-def read_data_file(file_path: str) -> List[float]:
+def read_data_file(file_path: str) -> np.ndarray:
     """
-    데이터 파일을 읽어서 float 리스트로 반환합니다.
+    데이터 파일을 읽어서 float64 배열로 반환합니다.
     
     Args:
         file_path: 데이터 파일 경로
         
     Returns:
-        float 값들의 리스트
+        float64 값들의 1차원 배열 (읽지 못하면 빈 배열)
     """
-    data = []
+    data = None
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                line = line.strip()
-                if line:
-                    try:
-                        value = float(line)
-                        data.append(value)
-                    except ValueError:
-                        print(f"경고: '{line}'는 유효한 숫자가 아닙니다. 건너뜁니다.")
+        # 숫자만 있는 파일은 np.loadtxt의 C 파서로 한 번에 읽음
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)  # 빈 파일 경고 무시
+                values = np.loadtxt(file_path, dtype=np.float64, comments=None, ndmin=2, encoding='utf-8')
+            # 한 줄에 값이 하나인 경우만 사용 (한 줄짜리 파일도 열 개수로 구분)
+            if values.shape[1] == 1:
+                data = values.ravel()
+        except ValueError:
+            pass
+        
+        # 숫자가 아닌 줄이 섞여 있으면 한 줄씩 다시 읽으며 해당 줄만 건너뜀
+        # (float 객체 리스트 대신 double을 연속으로 저장하는 array.array에 모음)
+        if data is None:
+            values = array.array('d')
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        try:
+                            value = float(line)
+                            values.append(value)
+                        except ValueError:
+                            print(f"경고: '{line}'는 유효한 숫자가 아닙니다. 건너뜁니다.")
+            data = np.frombuffer(values, dtype=np.float64)
         print(f"{file_path}에서 {len(data)}개의 데이터를 읽었습니다.")
         return data
     except FileNotFoundError:
         print(f"오류: 파일 '{file_path}'을 찾을 수 없습니다.")
-        return []
+        return np.empty(0)
     except Exception as e:
         print(f"오류: 파일을 읽는 중 문제가 발생했습니다: {e}")
-        return []
+        return np.empty(0)
 
 
 def main():
@@ -655,7 +702,7 @@ def main():
         
         # 데이터 읽기
         data = read_data_file(file_path)
-        if not data:
+        if len(data) == 0:
             continue
         
         # 자동 탐지 실행
@@ -689,21 +736,22 @@ def main():
         
         # 결과 저장
         output_file = f"{file_path.replace('.txt', '')}_unified_results.txt"
+        # 전체 내용을 문자열 조각으로 모은 뒤 한 번에 기록
+        parts = [f"=== {file_path} 통합 탐지 결과 ===\n",
+                 "탐지 방법: 자동 선택\n",
+                 f"로컬 최대값 개수: {len(maxima)}\n",
+                 f"로컬 최소값 개수: {len(minima)}\n\n"]
+        
+        if maxima:
+            parts.append("로컬 최대값들:\n")
+            parts.extend(f"{i+1:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n" for i, (idx, val) in enumerate(maxima))
+        
+        if minima:
+            parts.append("\n로컬 최소값들:\n")
+            parts.extend(f"{i+1:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n" for i, (idx, val) in enumerate(minima))
+        
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"=== {file_path} 통합 탐지 결과 ===\n")
-            f.write(f"탐지 방법: 자동 선택\n")
-            f.write(f"로컬 최대값 개수: {len(maxima)}\n")
-            f.write(f"로컬 최소값 개수: {len(minima)}\n\n")
-            
-            if maxima:
-                f.write("로컬 최대값들:\n")
-                for i, (idx, val) in enumerate(maxima):
-                    f.write(f"{i+1:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n")
-            
-            if minima:
-                f.write("\n로컬 최소값들:\n")
-                for i, (idx, val) in enumerate(minima):
-                    f.write(f"{i+1:3d}. 인덱스: {idx:4d}, 값: {val:12.8f}\n")
+            f.write(''.join(parts))
         
         print(f"\n결과가 {output_file}에 저장되었습니다.")
     